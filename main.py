@@ -1,45 +1,152 @@
+import argparse
+import contextlib
+import json
 import os
-from models.task import Task, TaskStatus, TaskPriority
+import shlex
+import sys
+from datetime import datetime
+from typing import Optional
+from models.task import Task, TaskStatus, TaskPriority, parse_enum
 from models.user import User
-from patterns.observer import TaskAssigneeObserver, TaskManagerObserver, TaskLogObserver
 from patterns.command import CommandInvoker, CreateTaskCommand, UpdateTaskStatusCommand, AssignTaskCommand
-from patterns.strategy import StatusFilterStrategy, AssigneeFilterStrategy, PriorityFilterStrategy, \
-    CompositeFilterStrategy
-from patterns.template_method import StatusReportGenerator, AssigneeReportGenerator, PriorityReportGenerator
-from patterns.chain_of_responsibility import TeamLeadApprovalHandler, ProjectManagerApprovalHandler, \
-    DirectorApprovalHandler
 from services.task_service import TaskService
 from services.report_service import ReportService
 
 
+# Report generators, filter strategies, the approval chain and snapshot support are imported
+# on first use so that short-lived invocations don't pay for subsystems they never touch.
+
+def _status_report_generator():
+    from patterns.template_method import StatusReportGenerator
+    return StatusReportGenerator()
+
+
+def _assignee_report_generator():
+    from patterns.template_method import AssigneeReportGenerator
+    return AssigneeReportGenerator()
+
+
+def _indexed_assignee_report_generator(task_service):
+    from patterns.template_method import IndexedAssigneeReportGenerator
+    return IndexedAssigneeReportGenerator(task_service)
+
+
+def _priority_report_generator():
+    from patterns.template_method import PriorityReportGenerator
+    return PriorityReportGenerator()
+
+
+def _flow_report_generator(task_service):
+    from patterns.template_method import FlowMetricsReportGenerator
+    return FlowMetricsReportGenerator(task_service.flow_metrics)
+
+
 class ProjectManagementCLI:
-    def __init__(self):
-        self.task_service = TaskService()
+    def __init__(self, sample_data: bool = True, snapshot_path: Optional[str] = None,
+                 notifications: bool = True, event_log_path: Optional[str] = None,
+                 shards: Optional[int] = None, coalesce_window: Optional[float] = None,
+                 coalesce_max_events: Optional[int] = None):
+        if shards:
+            from services.sharded_task_service import ShardedTaskService
+            self.task_service = ShardedTaskService(shards)
+        else:
+            self.task_service = TaskService()
         self.report_service = ReportService()
 
-        self.report_service.register_generator("status", StatusReportGenerator())
-        self.report_service.register_generator("assignee", AssigneeReportGenerator())
-        self.report_service.register_generator("priority", PriorityReportGenerator())
+        self.report_service.register_generator_factory("status", _status_report_generator)
+        if hasattr(self.task_service, "get_tasks_for_assignee"):
+            self.report_service.register_generator_factory(
+                "assignee", lambda: _indexed_assignee_report_generator(self.task_service))
+        else:
+            self.report_service.register_generator_factory("assignee", _assignee_report_generator)
+        self.report_service.register_generator_factory("priority", _priority_report_generator)
+        # Flow metrics live in the task service itself, so sharded mode has none to report
+        if hasattr(self.task_service, "flow_metrics"):
+            self.report_service.register_generator_factory("flow", lambda: _flow_report_generator(self.task_service))
 
         self.command_invoker = CommandInvoker()
+        self._team_lead = None
+        self.event_log = None
+        self.last_memory_report = None
 
-        self.team_lead = TeamLeadApprovalHandler()
-        self.project_manager = ProjectManagerApprovalHandler()
-        self.director = DirectorApprovalHandler()
+        self.current_user = User("admin", "Administrator")
+
+        # Seed before observers are attached so startup doesn't fan out notifications
+        if snapshot_path:
+            self.load_snapshot(snapshot_path)
+        elif sample_data:
+            self._create_sample_data()
+
+        if coalesce_window is not None or coalesce_max_events is not None:
+            self.task_service.subject.enable_coalescing(coalesce_window, coalesce_max_events)
 
-        self.team_lead.set_next(self.project_manager).set_next(self.director)
+        if notifications:
+            self._attach_observers(event_log_path)
+        elif event_log_path:
+            self._attach_event_log(event_log_path)
+
+    def _attach_observers(self, event_log_path: Optional[str]):
+        from patterns.observer import TaskAssigneeObserver, TaskManagerObserver, TaskLogObserver
 
         self.assignee_observer = TaskAssigneeObserver()
         self.manager_observer = TaskManagerObserver()
-        self.log_observer = TaskLogObserver()
 
         self.task_service.subject.attach(self.assignee_observer)
         self.task_service.subject.attach(self.manager_observer)
-        self.task_service.subject.attach(self.log_observer)
 
-        self.current_user = User("admin", "Administrator")
+        # The structured event log replaces the print-based log when configured
+        if event_log_path:
+            self._attach_event_log(event_log_path)
+        else:
+            self.log_observer = TaskLogObserver()
+            self.task_service.subject.attach(self.log_observer)
+
+    def _attach_event_log(self, path: str):
+        from patterns.observer import StructuredLogObserver
+        from services.event_log import EventLogWriter
 
-        self._create_sample_data()
+        self.event_log = EventLogWriter(path)
+        self.log_observer = StructuredLogObserver(self.event_log)
+        self.task_service.subject.attach(self.log_observer)
+
+    def memory_diagnostics(self):
+        from services.diagnostics import MemoryDiagnostics
+
+        # Sharded services keep their tasks in worker processes, so only local structures are measured
+        # The event log goes first so its buffer isn't charged to the observer that writes to it
+        roots = {"event_log": self.event_log} if self.event_log else {}
+        if hasattr(self.task_service, "memory_components"):
+            roots.update(self.task_service.memory_components())
+        roots["command_history"] = self.command_invoker.history
+        roots["report_service"] = self.report_service
+
+        return MemoryDiagnostics(roots, exclude=[self, self.task_service],
+                                 task_count=len(self.task_service.get_all_tasks()))
+
+    def close(self):
+        self.task_service.subject.flush()
+        if self.event_log:
+            self.event_log.close()
+        if hasattr(self.task_service, "close"):
+            self.task_service.close()
+
+    @property
+    def team_lead(self):
+        if self._team_lead is None:
+            from patterns.chain_of_responsibility import TeamLeadApprovalHandler, \
+                ProjectManagerApprovalHandler, DirectorApprovalHandler
+
+            self._team_lead = TeamLeadApprovalHandler()
+            self._team_lead.set_next(ProjectManagerApprovalHandler()).set_next(DirectorApprovalHandler())
+        return self._team_lead
+
+    def load_snapshot(self, path: str) -> int:
+        from services.snapshot_service import SnapshotService
+        return SnapshotService().load(self.task_service, path)
+
+    def save_snapshot(self, path: str, format: str = "json") -> int:
+        from services.snapshot_service import SnapshotService
+        return SnapshotService().save(self.task_service, path, format)
 
     def _create_sample_data(self):
         self.command_invoker.execute_command(
@@ -100,7 +207,8 @@ class ProjectManagementCLI:
         )
 
     def display_menu(self):
-        os.system('cls' if os.name == 'nt' else 'clear')
+        # ANSI clear-screen instead of spawning a `clear` subprocess on every loop
+        print("\033[2J\033[H", end="")
         menu = [
             "\n=== Project Management System ===",
             f"Current user: {self.current_user}",
@@ -115,6 +223,7 @@ class ProjectManagementCLI:
             "8. Generate report",
             "9. Request task approval",
             "10. Undo last action",
+            "11. Memory diagnostics",
             "0. Exit"
         ]
         print("\n".join(menu))
@@ -123,7 +232,7 @@ class ProjectManagementCLI:
         while True:
             try:
                 self.display_menu()
-                choice = input("\nEnter your choice (0-10): ")
+                choice = input("\nEnter your choice (0-11): ")
                 choice = int(choice)
 
                 if choice == 0:
@@ -149,15 +258,21 @@ class ProjectManagementCLI:
                     self.request_approval()
                 elif choice == 10:
                     self.command_invoker.undo_last_command()
+                elif choice == 11:
+                    self.show_memory_diagnostics()
                 else:
-                    print("\nInvalid choice. Please select a number between 0 and 10.")
+                    print("\nInvalid choice. Please select a number between 0 and 11.")
 
+                # Deliver anything the action left held back before waiting on the user
+                self.task_service.subject.flush()
                 input("\nPress Enter to continue...")
             except ValueError:
                 print("\nInvalid input. Please enter a valid number.")
+                self.task_service.subject.flush()
                 input("\nPress Enter to continue...")
             except Exception as e:
                 print(f"\nAn error occurred: {e}")
+                self.task_service.subject.flush()
                 input("\nPress Enter to continue...")
 
     def list_all_tasks(self):
@@ -292,8 +407,7 @@ class ProjectManagementCLI:
             choice = int(input("Select report type: "))
             if 1 <= choice <= len(available_reports):
                 report_name = available_reports[choice - 1]
-                tasks = self.task_service.get_all_tasks()
-                report = self.report_service.generate_report(report_name, tasks)
+                report = self.report_service.generate_report_from(report_name, self.task_service.get_all_tasks)
                 print(f"\n{report}")
             else:
                 print("\nInvalid choice.")
@@ -315,13 +429,38 @@ class ProjectManagementCLI:
         except ValueError:
             print("\nInvalid input. Please enter a valid number.")
 
+    def show_memory_diagnostics(self):
+        report = self.memory_diagnostics().take_report(top=10)
+
+        print("\n=== Memory Diagnostics ===")
+        for name, size in report.subsystems.items():
+            print(f"  {name}: {size / 1024:.1f} KiB")
+        print(f"Total: {report.total_bytes / 1024:.1f} KiB for {report.task_count} tasks "
+              f"({report.bytes_per_task:.0f} bytes per task)")
+
+        if self.last_memory_report:
+            growth = self.memory_diagnostics().compare(self.last_memory_report, report)
+            print(f"Growth since last check: {growth['total_bytes'] / 1024:+.1f} KiB")
+        self.last_memory_report = report
+
+        if report.top_allocations:
+            print("\nTop allocation sites:")
+            for site in report.top_allocations:
+                print(f"  {site['site']}: {site['size'] / 1024:.1f} KiB in {site['count']} blocks")
+        else:
+            print("\n(Start with --trace-memory to see top allocation sites)")
+
     def filter_tasks(self):
+        from patterns.strategy import StatusFilterStrategy, AssigneeFilterStrategy, PriorityFilterStrategy, \
+            CompositeFilterStrategy, ExpressionFilterStrategy
+
         try:
             print("\nFilter options:")
             print("1. Filter by status")
             print("2. Filter by assignee")
             print("3. Filter by priority")
             print("4. Combined filter")
+            print("5. Filter expression")
 
             choice = int(input("Select filter type: "))
 
@@ -402,6 +541,18 @@ class ProjectManagementCLI:
 
                 print("\n=== Tasks matching combined filters ===")
 
+            elif choice == 5:
+                print("\nExample: status IN (todo, review) AND (assignee = alex OR priority = critical)")
+                expression = input("Enter filter expression: ")
+                try:
+                    strategy = ExpressionFilterStrategy(expression)
+                except ValueError as e:
+                    print(f"\nInvalid filter expression: {e}")
+                    return
+                filtered_tasks = self.task_service.filter_tasks(strategy)
+
+                print(f"\n=== Tasks matching: {expression} ===")
+
             else:
                 print("\nInvalid choice.")
                 return
@@ -416,6 +567,409 @@ class ProjectManagementCLI:
             print("\nInvalid input. Please enter a valid number.")
 
 
+def _parse_datetime(text: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(text) if text else None
+
+
+class BatchRunner:
+    """Executes CLI commands from a script or stream and emits JSON Lines results.
+
+    Each non-empty line is a command in shell syntax, e.g.::
+
+        create "Write tests" "Cover the batch mode" assignee=alex priority=high
+        status 5 in_progress
+        comment 5 "Started on it" author=alex
+        filter status=done assignee=sam
+    """
+
+    FLUSH_EVERY = 1000
+
+    # Commands whose argument is taken verbatim instead of being split shell-style
+    RAW_COMMANDS = {"query"}
+
+    OPTIONS = {
+        "create": {"assignee", "priority"},
+        "comment": {"author"},
+        "events": {"task", "event"},
+        "save": {"format"},
+        "import": {"format", "comments", "notify", "upsert"},
+        "export": {"format", "comments"},
+        "memory": {"top"},
+        "filter": {"status", "assignee", "priority", "created_since", "created_before",
+                   "updated_since", "updated_before"},
+    }
+
+    def __init__(self, cli: ProjectManagementCLI, output, fail_fast: bool = False):
+        self.cli = cli
+        self.output = output
+        self.fail_fast = fail_fast
+        self._buffer = []
+        self._handlers = {
+            "list": self._list,
+            "show": self._show,
+            "create": self._create,
+            "assign": self._assign,
+            "status": self._status,
+            "comment": self._comment,
+            "filter": self._filter,
+            "query": self._query,
+            "report": self._report,
+            "approve": self._approve,
+            "undo": self._undo,
+            "save": self._save,
+            "changes": self._changes,
+            "history": self._history,
+            "workload": self._workload,
+            "memory": self._memory,
+            "events": self._events,
+            "import": self._import,
+            "export": self._export,
+        }
+
+    def run(self, lines) -> int:
+        errors = 0
+        try:
+            for line_no, line in enumerate(lines, 1):
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+
+                record = self.execute(line)
+                record["line"] = line_no
+                self._write(record)
+                self.cli.task_service.subject.flush_expired()
+
+                if not record["ok"]:
+                    errors += 1
+                    if self.fail_fast:
+                        break
+        finally:
+            self.cli.task_service.subject.flush()
+            self.flush()
+        return errors
+
+    def execute(self, line: str) -> dict:
+        command = None
+        try:
+            command, *rest = line.split(None, 1)
+            command = command.lower()
+            rest = rest[0] if rest else ""
+            handler = self._handlers.get(command)
+            if handler is None:
+                raise ValueError(f"Unknown command '{command}'")
+
+            if command in self.RAW_COMMANDS:
+                args, options = ([rest.strip()] if rest.strip() else []), {}
+            else:
+                args, options = self._split_options(command, shlex.split(rest))
+            record = {"command": command, "ok": True}
+            record.update(handler(args, options))
+            return record
+        except Exception as e:
+            return {"command": command, "ok": False, "error": str(e)}
+
+    def flush(self) -> None:
+        if self._buffer:
+            self.output.write("\n".join(self._buffer) + "\n")
+            self._buffer.clear()
+        self.output.flush()
+
+    def _write(self, record: dict) -> None:
+        self._buffer.append(json.dumps(record, separators=(",", ":")))
+        if len(self._buffer) >= self.FLUSH_EVERY:
+            self.flush()
+
+    def _split_options(self, command: str, tokens):
+        allowed = self.OPTIONS.get(command, set())
+        args, options = [], {}
+        for token in tokens:
+            key, sep, value = token.partition("=")
+            if sep and key in allowed:
+                options[key] = value
+            else:
+                args.append(token)
+        return args, options
+
+    def _require_task(self, args, position: int = 0):
+        if len(args) <= position:
+            raise ValueError("Missing task ID")
+        task_id = int(args[position])
+        task = self.cli.task_service.get_task_by_id(task_id)
+        if not task:
+            raise LookupError(f"Task with ID {task_id} not found")
+        return task
+
+    def _list(self, args, options) -> dict:
+        tasks = self.cli.task_service.get_all_tasks()
+        return {"count": len(tasks), "tasks": [task.to_dict() for task in tasks]}
+
+    def _show(self, args, options) -> dict:
+        return {"task": self._require_task(args).to_dict()}
+
+    def _create(self, args, options) -> dict:
+        if not args:
+            raise ValueError("Missing task title")
+        priority = parse_enum(TaskPriority, options["priority"]) if "priority" in options else TaskPriority.MEDIUM
+
+        command = CreateTaskCommand(
+            self.cli.task_service,
+            args[0],
+            " ".join(args[1:]),
+            options.get("assignee") or None,
+            priority
+        )
+        self.cli.command_invoker.execute_command(command)
+        task = self.cli.task_service.get_task_by_id(command.created_task_id)
+        return {"task": task.to_dict()}
+
+    def _assign(self, args, options) -> dict:
+        task = self._require_task(args)
+        assignee = " ".join(args[1:]).strip() or None
+
+        self.cli.command_invoker.execute_command(AssignTaskCommand(self.cli.task_service, task.id, assignee))
+        return {"task": self.cli.task_service.get_task_by_id(task.id).to_dict()}
+
+    def _status(self, args, options) -> dict:
+        task = self._require_task(args)
+        if len(args) < 2:
+            raise ValueError("Missing status")
+        new_status = parse_enum(TaskStatus, " ".join(args[1:]))
+
+        self.cli.command_invoker.execute_command(UpdateTaskStatusCommand(self.cli.task_service, task.id, new_status))
+        return {"task": self.cli.task_service.get_task_by_id(task.id).to_dict()}
+
+    def _comment(self, args, options) -> dict:
+        task = self._require_task(args)
+        comment = " ".join(args[1:])
+        if not comment:
+            raise ValueError("Missing comment text")
+        author = options.get("author") or self.cli.current_user.username
+
+        task = self.cli.task_service.add_comment(task.id, comment, author)
+        return {"task": task.to_dict()}
+
+    def _filter(self, args, options) -> dict:
+        from patterns.strategy import StatusFilterStrategy, AssigneeFilterStrategy, PriorityFilterStrategy, \
+            CompositeFilterStrategy, CreatedDateRangeFilterStrategy, UpdatedDateRangeFilterStrategy
+
+        strategies = []
+        if "created_since" in options or "created_before" in options:
+            strategies.append(CreatedDateRangeFilterStrategy(_parse_datetime(options.get("created_since")),
+                                                             _parse_datetime(options.get("created_before"))))
+        if "updated_since" in options or "updated_before" in options:
+            strategies.append(UpdatedDateRangeFilterStrategy(_parse_datetime(options.get("updated_since")),
+                                                             _parse_datetime(options.get("updated_before"))))
+        if "status" in options:
+            strategies.append(StatusFilterStrategy(parse_enum(TaskStatus, options["status"])))
+        if "assignee" in options:
+            strategies.append(AssigneeFilterStrategy(options["assignee"]))
+        if "priority" in options:
+            strategies.append(PriorityFilterStrategy(parse_enum(TaskPriority, options["priority"])))
+
+        tasks = self.cli.task_service.filter_tasks(CompositeFilterStrategy(strategies))
+        return {"count": len(tasks), "tasks": [task.to_dict() for task in tasks]}
+
+    def _query(self, args, options) -> dict:
+        from patterns.strategy import ExpressionFilterStrategy
+
+        if not args:
+            raise ValueError("Missing filter expression")
+        tasks = self.cli.task_service.filter_tasks(ExpressionFilterStrategy(" ".join(args)))
+        return {"count": len(tasks), "tasks": [task.to_dict() for task in tasks]}
+
+    def _report(self, args, options) -> dict:
+        if not args:
+            raise ValueError("Missing report name")
+        name = args[0].lower()
+        if name not in self.cli.report_service.get_available_reports():
+            raise LookupError(f"Report generator '{name}' not found")
+
+        return {"report": self.cli.report_service.generate_report_from(name, self.cli.task_service.get_all_tasks)}
+
+    def _approve(self, args, options) -> dict:
+        task = self._require_task(args)
+        return {"task_id": task.id, "result": self.cli.team_lead.handle(task)}
+
+    def _undo(self, args, options) -> dict:
+        if args:
+            return {"undone": self.cli.command_invoker.undo_commands(int(args[0]))}
+        return {"undone": self.cli.command_invoker.undo_last_command()}
+
+    def _memory(self, args, options) -> dict:
+        diagnostics = self.cli.memory_diagnostics()
+        report = diagnostics.take_report(top=int(options.get("top", 0)))
+
+        record = report.to_dict()
+        if self.cli.last_memory_report:
+            record["growth"] = diagnostics.compare(self.cli.last_memory_report, report,
+                                                   top=int(options.get("top", 0)))
+        self.cli.last_memory_report = report
+        return record
+
+    def _workload(self, args, options) -> dict:
+        task_service = self.cli.task_service
+        assignees = [" ".join(args)] if args else task_service.get_assignees()
+
+        workloads = {}
+        for assignee in assignees:
+            workload = task_service.get_assignee_workload(assignee)
+            workloads[assignee] = dict(workload.to_dict(), task_ids=list(workload.task_ids)) if workload else None
+        return {"workloads": workloads}
+
+    def _history(self, args, options) -> dict:
+        task = self._require_task(args)
+        history = self.cli.task_service.get_status_history(task.id)
+        return {
+            "task_id": task.id,
+            "transitions": [{"at": at.isoformat(), "status": status.name} for at, status in history]
+        }
+
+    def _changes(self, args, options) -> dict:
+        if not hasattr(self.cli.task_service, "changes_since"):
+            raise ValueError("The change feed is per shard and is not available with --shards")
+        seq = int(args[0]) if args else 0
+        return self.cli.task_service.changes_since(seq).to_dict()
+
+    def _events(self, args, options) -> dict:
+        from services.event_log import EventLogReader
+
+        if not self.cli.event_log:
+            raise ValueError("Event log is not enabled (start with --event-log PATH)")
+        self.cli.task_service.subject.flush()
+        self.cli.event_log.flush()
+
+        task_id = int(options["task"]) if "task" in options else None
+        reader = EventLogReader(self.cli.event_log.path)
+        records = list(reader.read(task_id=task_id, event_type=options.get("event")))
+        return {"count": len(records), "events": records}
+
+    def _import(self, args, options) -> dict:
+        from services.import_export_service import ImportExportService
+
+        if not args:
+            raise ValueError("Missing import path")
+        notify = options.get("notify", "").lower() in ("1", "true", "yes")
+        upsert = options.get("upsert", "").lower() in ("1", "true", "yes")
+        service = ImportExportService()
+
+        record = {"tasks": service.import_tasks(self.cli.task_service, args[0], options.get("format"),
+                                                notify, upsert).to_dict()}
+        if options.get("comments"):
+            record["comments"] = service.import_comments(self.cli.task_service, options["comments"],
+                                                         notify=notify).to_dict()
+        return record
+
+    def _export(self, args, options) -> dict:
+        from services.import_export_service import ImportExportService
+
+        if not args:
+            raise ValueError("Missing export path")
+        service = ImportExportService()
+        tasks = self.cli.task_service.get_all_tasks()
+
+        record = {"tasks": service.export_tasks(tasks, args[0], options.get("format")).to_dict()}
+        if options.get("comments"):
+            record["comments"] = service.export_comments(tasks, options["comments"]).to_dict()
+        return record
+
+    def _save(self, args, options) -> dict:
+        if not args:
+            raise ValueError("Missing snapshot path")
+        return {"path": args[0], "count": self.cli.save_snapshot(args[0], options.get("format", "json"))}
+
+
+def report_from_snapshot(path: str, report_name: str) -> str:
+    """Generate a report straight from a memory-mapped binary snapshot, without a TaskService"""
+    from services.snapshot_service import SnapshotService
+
+    report_service = ReportService()
+    report_service.register_generator_factory("status", _status_report_generator)
+    report_service.register_generator_factory("assignee", _assignee_report_generator)
+    report_service.register_generator_factory("priority", _priority_report_generator)
+
+    available = report_service.get_available_reports()
+    if report_name not in available:
+        raise LookupError(f"Report generator '{report_name}' not found. Expected one of: {', '.join(available)}")
+
+    with SnapshotService().open_binary(path) as snapshot:
+        return report_service.generate_report(report_name, snapshot)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Project Management System")
+    parser.add_argument("--batch", metavar="SCRIPT", nargs="?", const="-",
+                        help="run commands from SCRIPT (or stdin when omitted or '-') and print JSON Lines results")
+    parser.add_argument("--fail-fast", action="store_true",
+                        help="stop a batch at the first failing command")
+    parser.add_argument("--quiet", action="store_true",
+                        help="discard notifications in batch mode instead of writing them to stderr")
+    parser.add_argument("--no-sample-data", action="store_true",
+                        help="start with an empty task store")
+    parser.add_argument("--load-snapshot", metavar="PATH",
+                        help="preload tasks from a JSON or binary snapshot written by the 'save' batch command")
+    parser.add_argument("--event-log", metavar="PATH",
+                        help="write structured JSON Lines events to PATH instead of printing log lines")
+    parser.add_argument("--snapshot-report", nargs=2, metavar=("SNAPSHOT", "REPORT"),
+                        help="print REPORT computed directly from a binary snapshot and exit")
+    parser.add_argument("--shards", type=int, metavar="N",
+                        help="partition tasks across N worker processes")
+    parser.add_argument("--coalesce-window", type=float, metavar="SECONDS",
+                        help="merge consecutive events for the same task within SECONDS into one notification")
+    parser.add_argument("--coalesce-count", type=int, metavar="N",
+                        help="deliver merged events once N have accumulated for a task")
+    parser.add_argument("--trace-memory", action="store_true",
+                        help="trace allocations with tracemalloc so memory diagnostics can show top sites")
+    args = parser.parse_args(argv)
+
+    if args.trace_memory:
+        from services.diagnostics import MemoryDiagnostics
+        MemoryDiagnostics.start_tracing()
+
+    if args.snapshot_report:
+        try:
+            print(report_from_snapshot(*args.snapshot_report))
+        except (OSError, ValueError) as e:
+            print(f"Cannot read snapshot: {e}", file=sys.stderr)
+            return 1
+        except LookupError as e:
+            print(e, file=sys.stderr)
+            return 1
+        return 0
+
+    options = {
+        "sample_data": not args.no_sample_data,
+        "snapshot_path": args.load_snapshot,
+        "event_log_path": args.event_log,
+        "shards": args.shards,
+        "coalesce_window": args.coalesce_window,
+        "coalesce_max_events": args.coalesce_count,
+    }
+
+    if args.batch is None:
+        app = ProjectManagementCLI(**options)
+        try:
+            app.run()
+        finally:
+            app.close()
+        return 0
+
+    # Keep stdout reserved for JSON records; observer notifications go to stderr (or nowhere)
+    output = sys.stdout
+    with contextlib.ExitStack() as stack:
+        sink = stack.enter_context(open(os.devnull, "w")) if args.quiet else sys.stderr
+        stack.enter_context(contextlib.redirect_stdout(sink))
+
+        app = ProjectManagementCLI(notifications=not args.quiet, **options)
+        stack.callback(app.close)
+        runner = BatchRunner(app, output, fail_fast=args.fail_fast)
+        if args.batch == "-":
+            errors = runner.run(sys.stdin)
+        else:
+            with open(args.batch, encoding="utf-8") as script:
+                errors = runner.run(script)
+
+    return 1 if errors else 0
+
+
 if __name__ == "__main__":
-    app = ProjectManagementCLI()
-    app.run()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
@@ -1,6 +1,6 @@
 from enum import Enum
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Union
 
 
 class TaskStatus(Enum):
@@ -17,6 +17,25 @@ class TaskPriority(Enum):
     CRITICAL = "Critical"
 
 
+def parse_enum(enum_cls, text: str):
+    """Resolve a TaskStatus/TaskPriority from its name ("in_progress") or display value ("In Progress")"""
+    key = text.strip().upper().replace(" ", "_").replace("-", "_")
+    for member in enum_cls:
+        if member.name == key or member.value.upper() == text.strip().upper():
+            return member
+    choices = ", ".join(member.name for member in enum_cls)
+    raise ValueError(f"Invalid {enum_cls.__name__} '{text}'. Expected one of: {choices}")
+
+
+def parse_timestamp(value: Union[str, datetime]) -> datetime:
+    """Parse an ISO timestamp; timezone-aware values are converted to naive local time like datetime.now()"""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is not None:
+        value = value.astimezone().replace(tzinfo=None)
+    return value
+
+
 class Task:
     def __init__(self, id: int, title: str, description: str,
                  assignee: Optional[str] = None,
@@ -35,6 +54,10 @@ class Task:
         self.status = status
         self.updated_at = datetime.now()
 
+    def assign(self, assignee: Optional[str]) -> None:
+        self.assignee = assignee
+        self.updated_at = datetime.now()
+
     def add_comment(self, comment: str, author: str) -> None:
         self.comments.append({
             "comment": comment,
@@ -43,6 +66,50 @@ class Task:
         })
         self.updated_at = datetime.now()
 
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "title": self.title,
+            "description": self.description,
+            "status": self.status.name,
+            "priority": self.priority.name,
+            "assignee": self.assignee,
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat(),
+            "comments": [
+                {
+                    "comment": comment["comment"],
+                    "author": comment["author"],
+                    "timestamp": comment["timestamp"].isoformat()
+                }
+                for comment in self.comments
+            ]
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Task":
+        task = cls(
+            id=int(data["id"]),
+            title=data["title"],
+            description=data.get("description", ""),
+            assignee=data.get("assignee"),
+            priority=TaskPriority[data.get("priority", TaskPriority.MEDIUM.name)]
+        )
+        task.status = TaskStatus[data.get("status", TaskStatus.TODO.name)]
+        if data.get("created_at"):
+            task.created_at = parse_timestamp(data["created_at"])
+        if data.get("updated_at"):
+            task.updated_at = parse_timestamp(data["updated_at"])
+        task.comments = [
+            {
+                "comment": comment["comment"],
+                "author": comment["author"],
+                "timestamp": parse_timestamp(comment["timestamp"])
+            }
+            for comment in data.get("comments", [])
+        ]
+        return task
+
     def __str__(self) -> str:
         return f"Task #{self.id}: {self.title} [{self.status.value}] - Assigned to: {self.assignee or 'Unassigned'}"
 
@@ -83,14 +83,28 @@ class CommandInvoker:
     def __init__(self):
         self._history: List[Command] = []
 
+    @property
+    def history(self) -> List[Command]:
+        return self._history
+
     def execute_command(self, command: Command) -> None:
         command.execute()
         self._history.append(command)
 
-    def undo_last_command(self) -> None:
+    def undo_last_command(self) -> bool:
         if self._history:
             command = self._history.pop()
             command.undo()
             print(f"Undid last command")
+            return True
         else:
-            print("No commands to undo")
\ No newline at end of file
+            print("No commands to undo")
+            return False
+
+    def undo_commands(self, count: int) -> int:
+        undone = 0
+        while undone < count and self._history:
+            self._history.pop().undo()
+            undone += 1
+        print(f"Undid {undone} command(s)")
+        return undone
\ No newline at end of file
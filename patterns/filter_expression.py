@@ -0,0 +1,346 @@
+import operator
+import re
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from typing import Any, Callable, Iterable, List, Optional, Set
+from models.task import Task, TaskStatus, TaskPriority, parse_enum
+
+Predicate = Callable[[Task], bool]
+
+FIELDS = {"id", "title", "description", "status", "priority", "assignee", "created_at", "updated_at"}
+FIELD_ALIASES = {"created": "created_at", "updated": "updated_at"}
+TIME_FIELDS = {"created_at", "updated_at"}
+TEXT_FIELDS = {"title", "description", "assignee"}
+
+_OPERATORS = {
+    "=": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+
+class Expression(ABC):
+    """Node of a filter expression; compiles to one predicate so filtering is a single pass"""
+
+    @abstractmethod
+    def compile(self) -> Predicate:
+        pass
+
+    def candidates(self, indexes) -> Optional[Set[int]]:
+        """Superset of matching task ids from the provider's indexes, or None if a full scan is needed.
+
+        ``indexes`` offers ``lookup_equal(field, value)`` and ``lookup_range(field, start, end)``,
+        each returning task ids or None when that field isn't indexed.
+        """
+        return None
+
+    def filter(self, tasks: Iterable[Task]) -> List[Task]:
+        predicate = self.compile()
+        return [task for task in tasks if predicate(task)]
+
+
+class Comparison(Expression):
+    def __init__(self, field: str, op: str, value: Any):
+        self.field = field
+        self.op = op
+        self.value = value
+
+    def compile(self) -> Predicate:
+        get, value, compare = operator.attrgetter(self.field), self.value, _OPERATORS[self.op]
+        if self.op == "=":
+            return lambda task: get(task) == value
+        if self.op == "!=":
+            return lambda task: get(task) != value
+        # Ordering against a missing value (e.g. unassigned) never matches
+        return lambda task: (current := get(task)) is not None and compare(current, value)
+
+    def candidates(self, indexes) -> Optional[Set[int]]:
+        if self.op == "=":
+            return _as_set(indexes.lookup_equal(self.field, self.value))
+        if self.field in TIME_FIELDS:
+            if self.op in (">", ">="):
+                return _as_set(indexes.lookup_range(self.field, self.value, None))
+            if self.op == "<":
+                return _as_set(indexes.lookup_range(self.field, None, self.value))
+            if self.op == "<=":
+                return _as_set(indexes.lookup_range(self.field, None, self.value + timedelta(microseconds=1)))
+        return None
+
+
+class In(Expression):
+    def __init__(self, field: str, values: Iterable[Any]):
+        self.field = field
+        self.values = list(values)
+
+    def compile(self) -> Predicate:
+        get, values = operator.attrgetter(self.field), set(self.values)
+        return lambda task: get(task) in values
+
+    def candidates(self, indexes) -> Optional[Set[int]]:
+        result = set()
+        for value in self.values:
+            ids = indexes.lookup_equal(self.field, value)
+            if ids is None:
+                return None
+            result.update(ids)
+        return result
+
+
+class Contains(Expression):
+    """Case-insensitive substring match on a text field"""
+
+    def __init__(self, field: str, text: str):
+        self.field = field
+        self.text = text
+
+    def compile(self) -> Predicate:
+        get, needle = operator.attrgetter(self.field), self.text.lower()
+        return lambda task: needle in (get(task) or "").lower()
+
+
+class Not(Expression):
+    def __init__(self, expression: Expression):
+        self.expression = expression
+
+    def compile(self) -> Predicate:
+        predicate = self.expression.compile()
+        return lambda task: not predicate(task)
+
+
+class And(Expression):
+    def __init__(self, expressions: Iterable[Expression]):
+        self.expressions = list(expressions)
+
+    def compile(self) -> Predicate:
+        predicates = [expression.compile() for expression in self.expressions]
+        if not predicates:
+            return lambda task: True
+        return _fold(predicates, _both)
+
+    def candidates(self, indexes) -> Optional[Set[int]]:
+        # Any indexed conjunct narrows the scan; the full predicate still runs on what's left
+        result = None
+        for expression in self.expressions:
+            ids = expression.candidates(indexes)
+            if ids is not None:
+                result = ids if result is None else result & ids
+        return result
+
+
+class Or(Expression):
+    def __init__(self, expressions: Iterable[Expression]):
+        self.expressions = list(expressions)
+
+    def compile(self) -> Predicate:
+        predicates = [expression.compile() for expression in self.expressions]
+        if not predicates:
+            return lambda task: False
+        return _fold(predicates, _either)
+
+    def candidates(self, indexes) -> Optional[Set[int]]:
+        result = set()
+        for expression in self.expressions:
+            ids = expression.candidates(indexes)
+            if ids is None:
+                return None
+            result |= ids
+        return result
+
+
+class StrategyExpression(Expression):
+    """Adapter for FilterStrategy subclasses that only implement filter()"""
+
+    def __init__(self, strategy):
+        self.strategy = strategy
+
+    def compile(self) -> Predicate:
+        strategy = self.strategy
+        return lambda task: bool(strategy.filter([task]))
+
+    def filter(self, tasks: Iterable[Task]) -> List[Task]:
+        return self.strategy.filter(list(tasks))
+
+
+def _both(first: Predicate, second: Predicate) -> Predicate:
+    return lambda task: first(task) and second(task)
+
+
+def _either(first: Predicate, second: Predicate) -> Predicate:
+    return lambda task: first(task) or second(task)
+
+
+def _fold(predicates: List[Predicate], combine: Callable[[Predicate, Predicate], Predicate]) -> Predicate:
+    # Nest right-to-left so evaluation still short-circuits in the written order
+    result = predicates[-1]
+    for predicate in reversed(predicates[:-1]):
+        result = combine(predicate, result)
+    return result
+
+
+def _as_set(ids: Optional[Iterable[int]]) -> Optional[Set[int]]:
+    return None if ids is None else set(ids)
+
+
+# --- Text syntax -------------------------------------------------------------------------------
+#
+#   status = "In Progress" AND (assignee IN (alex, maria) OR NOT priority = low)
+#   updated >= 2024-05-01 AND title CONTAINS login AND assignee != NULL
+
+_TOKEN = re.compile(r"""
+    \s*(?:
+        (?P<punct>[(),])
+      | (?P<op>==|!=|<=|>=|=|<|>)
+      | "(?P<dq>(?:[^"\\]|\\.)*)"
+      | '(?P<sq>(?:[^'\\]|\\.)*)'
+      | (?P<word>[^\s(),=!<>"']+)
+    )""", re.VERBOSE)
+
+
+class _Parser:
+    def __init__(self, text: str):
+        self.tokens = self._tokenize(text)
+        self.pos = 0
+
+    @staticmethod
+    def _tokenize(text: str) -> List[tuple]:
+        tokens, pos = [], 0
+        text = text.rstrip()
+        while pos < len(text):
+            match = _TOKEN.match(text, pos)
+            if not match or match.end() == pos:
+                raise ValueError(f"Unexpected character at position {pos}: {text[pos:pos + 10]!r}")
+            pos = match.end()
+            if match.group("punct"):
+                tokens.append(("punct", match.group("punct")))
+            elif match.group("op"):
+                op = match.group("op")
+                tokens.append(("op", "=" if op == "==" else op))
+            elif match.group("dq") is not None or match.group("sq") is not None:
+                raw = match.group("dq") if match.group("dq") is not None else match.group("sq")
+                tokens.append(("string", re.sub(r"\\(.)", r"\1", raw)))
+            else:
+                tokens.append(("word", match.group("word")))
+        return tokens
+
+    def parse(self) -> Expression:
+        expression = self._or()
+        if self.pos < len(self.tokens):
+            raise ValueError(f"Unexpected token '{self.tokens[self.pos][1]}'")
+        return expression
+
+    def _peek_keyword(self, keyword: str) -> bool:
+        if self.pos < len(self.tokens):
+            kind, value = self.tokens[self.pos]
+            return kind == "word" and value.upper() == keyword
+        return False
+
+    def _next(self) -> tuple:
+        if self.pos >= len(self.tokens):
+            raise ValueError("Unexpected end of expression")
+        token = self.tokens[self.pos]
+        self.pos += 1
+        return token
+
+    def _expect(self, kind: str, value: str) -> None:
+        token = self._next()
+        if token != (kind, value):
+            raise ValueError(f"Expected '{value}' but found '{token[1]}'")
+
+    def _or(self) -> Expression:
+        expressions = [self._and()]
+        while self._peek_keyword("OR"):
+            self.pos += 1
+            expressions.append(self._and())
+        return expressions[0] if len(expressions) == 1 else Or(expressions)
+
+    def _and(self) -> Expression:
+        expressions = [self._not()]
+        while self._peek_keyword("AND"):
+            self.pos += 1
+            expressions.append(self._not())
+        return expressions[0] if len(expressions) == 1 else And(expressions)
+
+    def _not(self) -> Expression:
+        if self._peek_keyword("NOT"):
+            self.pos += 1
+            return Not(self._not())
+        if self.pos < len(self.tokens) and self.tokens[self.pos] == ("punct", "("):
+            self.pos += 1
+            expression = self._or()
+            self._expect("punct", ")")
+            return expression
+        return self._comparison()
+
+    def _comparison(self) -> Expression:
+        kind, name = self._next()
+        if kind != "word":
+            raise ValueError(f"Expected a field name but found '{name}'")
+        field = FIELD_ALIASES.get(name.lower(), name.lower())
+        if field not in FIELDS:
+            raise ValueError(f"Unknown field '{name}'. Expected one of: {', '.join(sorted(FIELDS))}")
+
+        negate = False
+        if self._peek_keyword("NOT"):
+            self.pos += 1
+            negate = True
+            if not self._peek_keyword("IN"):
+                raise ValueError("Expected IN after NOT")
+
+        if self._peek_keyword("IN"):
+            self.pos += 1
+            self._expect("punct", "(")
+            values = [self._value(field)]
+            while self.tokens[self.pos:self.pos + 1] == [("punct", ",")]:
+                self.pos += 1
+                values.append(self._value(field))
+            self._expect("punct", ")")
+            expression = In(field, values)
+            return Not(expression) if negate else expression
+
+        if self._peek_keyword("CONTAINS"):
+            self.pos += 1
+            if field not in TEXT_FIELDS:
+                raise ValueError(f"CONTAINS only applies to {', '.join(sorted(TEXT_FIELDS))}")
+            kind, text = self._next()
+            if kind not in ("word", "string"):
+                raise ValueError(f"Expected text after CONTAINS but found '{text}'")
+            return Contains(field, text)
+
+        kind, op = self._next()
+        if kind != "op":
+            raise ValueError(f"Expected a comparison operator after '{name}' but found '{op}'")
+        if op not in ("=", "!=") and field in ("status", "priority"):
+            raise ValueError(f"'{field}' only supports =, !=, IN and NOT IN")
+        value = self._value(field)
+        if value is None and op not in ("=", "!="):
+            raise ValueError("NULL can only be compared with = or !=")
+        return Comparison(field, op, value)
+
+    def _value(self, field: str) -> Any:
+        kind, raw = self._next()
+        if kind not in ("word", "string"):
+            raise ValueError(f"Expected a value but found '{raw}'")
+        if kind == "word" and raw.upper() == "NULL":
+            return None
+        return coerce_value(field, raw)
+
+
+def coerce_value(field: str, raw: Any) -> Any:
+    if not isinstance(raw, str):
+        return raw
+    if field == "status":
+        return parse_enum(TaskStatus, raw)
+    if field == "priority":
+        return parse_enum(TaskPriority, raw)
+    if field == "id":
+        return int(raw)
+    if field in TIME_FIELDS:
+        return datetime.fromisoformat(raw)
+    return raw
+
+
+def parse_expression(text: str) -> Expression:
+    return _Parser(text).parse()
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List
+import time
+from typing import List, Optional
 from models.task import Task, TaskStatus
 
 
@@ -8,6 +9,10 @@ class Observer(ABC):
     def update(self, task: Task, event_type: str) -> None:
         pass
 
+    def update_batch(self, task: Task, event_types: List[str]) -> None:
+        """Receives several coalesced events for one task; by default they are reported as one update"""
+        self.update(task, ", ".join(event_types))
+
 
 class Subject(ABC):
     @abstractmethod
@@ -24,8 +29,28 @@ class Subject(ABC):
 
 
 class TaskSubject(Subject):
-    def __init__(self):
+    """Publishes task events to observers.
+
+    With coalescing enabled, consecutive events for the same task are held back and delivered
+    as a single update_batch call once another task's event arrives, ``coalesce_window`` seconds
+    pass since the first held event, ``coalesce_max_events`` accumulate, or flush() is called.
+    """
+
+    def __init__(self, coalesce_window: Optional[float] = None, coalesce_max_events: Optional[int] = None):
         self._observers: List[Observer] = []
+        self._pending_task: Optional[Task] = None
+        self._pending_events: List[str] = []
+        self._pending_since = 0.0
+        self.enable_coalescing(coalesce_window, coalesce_max_events)
+
+    def enable_coalescing(self, window: Optional[float] = None, max_events: Optional[int] = None) -> None:
+        self.flush()
+        self.coalesce_window = window
+        self.coalesce_max_events = max_events
+        self._coalescing = window is not None or max_events is not None
+
+    def disable_coalescing(self) -> None:
+        self.enable_coalescing(None, None)
 
     def attach(self, observer: Observer) -> None:
         if observer not in self._observers:
@@ -35,9 +60,46 @@ class TaskSubject(Subject):
         if observer in self._observers:
             self._observers.remove(observer)
 
+    def has_observers(self) -> bool:
+        return bool(self._observers)
+
     def notify(self, task: Task, event_type: str) -> None:
-        for observer in self._observers:
-            observer.update(task, event_type)
+        if not self._coalescing:
+            self._deliver(task, [event_type])
+            return
+
+        if self._pending_task is not None and (self._pending_task.id != task.id or self._window_elapsed()):
+            self.flush()
+
+        if self._pending_task is None:
+            self._pending_since = time.monotonic()
+        self._pending_task = task
+        self._pending_events.append(event_type)
+
+        if self.coalesce_max_events and len(self._pending_events) >= self.coalesce_max_events:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._pending_task is not None:
+            task, events = self._pending_task, self._pending_events
+            self._pending_task, self._pending_events = None, []
+            self._deliver(task, events)
+
+    def flush_expired(self) -> None:
+        """Deliver held events whose window has passed; call periodically from an event loop"""
+        if self._pending_task is not None and self._window_elapsed():
+            self.flush()
+
+    def _window_elapsed(self) -> bool:
+        return self.coalesce_window is not None and time.monotonic() - self._pending_since >= self.coalesce_window
+
+    def _deliver(self, task: Task, event_types: List[str]) -> None:
+        if len(event_types) == 1:
+            for observer in self._observers:
+                observer.update(task, event_types[0])
+        else:
+            for observer in self._observers:
+                observer.update_batch(task, event_types)
 
 
 class TaskAssigneeObserver(Observer):
@@ -53,8 +115,44 @@ class TaskManagerObserver(Observer):
         elif event_type == "created":
             print(f"\n[MANAGER NOTIFICATION] New task created: '{task.title}'")
 
+    def update_batch(self, task: Task, event_types: List[str]) -> None:
+        # The task already reflects the whole burst, so only its last relevant event is reported
+        if event_types[-1] == "deleted":
+            return
+        relevant = [event_type for event_type in event_types if event_type in ("created", "status_changed")]
+        if relevant:
+            self.update(task, relevant[-1])
+
 
 class TaskLogObserver(Observer):
     def update(self, task: Task, event_type: str) -> None:
         print(
             f"\n[LOG] Task #{task.id} '{task.title}' - Event: {event_type} - Time: {task.updated_at.strftime('%Y-%m-%d %H:%M')}")
+
+
+class StructuredLogObserver(Observer):
+    """Writes one structured record per event to a buffered writer (see services.event_log)"""
+
+    def __init__(self, writer):
+        self.writer = writer
+
+    def update(self, task: Task, event_type: str) -> None:
+        self.writer.write({
+            "task_id": task.id,
+            "event": event_type,
+            "ts": time.time(),
+            "title": task.title,
+            "status": task.status.name,
+            "assignee": task.assignee
+        })
+
+    def update_batch(self, task: Task, event_types: List[str]) -> None:
+        self.writer.write({
+            "task_id": task.id,
+            "event": "coalesced",
+            "events": event_types,
+            "ts": time.time(),
+            "title": task.title,
+            "status": task.status.name,
+            "assignee": task.assignee
+        })
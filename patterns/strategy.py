@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import List
+from datetime import datetime
+from typing import List, Optional, Union
 from models.task import Task, TaskStatus, TaskPriority
+from patterns.filter_expression import Expression, Comparison, And, StrategyExpression, parse_expression
 
 
 class FilterStrategy(ABC):
@@ -8,13 +10,20 @@ class FilterStrategy(ABC):
     def filter(self, tasks: List[Task]) -> List[Task]:
         pass
 
+    def to_expression(self) -> Expression:
+        """Lower this strategy into a filter expression; custom strategies fall back to filter()"""
+        return StrategyExpression(self)
+
 
 class StatusFilterStrategy(FilterStrategy):
     def __init__(self, status: TaskStatus):
         self.status = status
 
     def filter(self, tasks: List[Task]) -> List[Task]:
-        return [task for task in tasks if task.status == self.status]
+        return self.to_expression().filter(tasks)
+
+    def to_expression(self) -> Expression:
+        return Comparison("status", "=", self.status)
 
 
 class AssigneeFilterStrategy(FilterStrategy):
@@ -22,7 +31,10 @@ class AssigneeFilterStrategy(FilterStrategy):
         self.assignee = assignee
 
     def filter(self, tasks: List[Task]) -> List[Task]:
-        return [task for task in tasks if task.assignee == self.assignee]
+        return self.to_expression().filter(tasks)
+
+    def to_expression(self) -> Expression:
+        return Comparison("assignee", "=", self.assignee)
 
 
 class PriorityFilterStrategy(FilterStrategy):
@@ -30,7 +42,10 @@ class PriorityFilterStrategy(FilterStrategy):
         self.priority = priority
 
     def filter(self, tasks: List[Task]) -> List[Task]:
-        return [task for task in tasks if task.priority == self.priority]
+        return self.to_expression().filter(tasks)
+
+    def to_expression(self) -> Expression:
+        return Comparison("priority", "=", self.priority)
 
 
 class CompositeFilterStrategy(FilterStrategy):
@@ -38,7 +53,55 @@ class CompositeFilterStrategy(FilterStrategy):
         self.strategies = strategies
 
     def filter(self, tasks: List[Task]) -> List[Task]:
-        result = tasks
-        for strategy in self.strategies:
-            result = strategy.filter(result)
-        return result
\ No newline at end of file
+        # One pass over the tasks with every predicate combined, instead of one list per strategy
+        return self.to_expression().filter(tasks)
+
+    def to_expression(self) -> Expression:
+        return And(strategy.to_expression() for strategy in self.strategies)
+
+
+class DateRangeFilterStrategy(FilterStrategy):
+    """Keeps tasks whose timestamp field falls in [start, end); either bound may be omitted"""
+
+    field = None
+
+    def __init__(self, start: Optional[datetime] = None, end: Optional[datetime] = None):
+        self.start = start
+        self.end = end
+
+    def filter(self, tasks: List[Task]) -> List[Task]:
+        return self.to_expression().filter(tasks)
+
+    def to_expression(self) -> Expression:
+        bounds = []
+        if self.start is not None:
+            bounds.append(Comparison(self.field, ">=", self.start))
+        if self.end is not None:
+            bounds.append(Comparison(self.field, "<", self.end))
+        return And(bounds)
+
+
+class CreatedDateRangeFilterStrategy(DateRangeFilterStrategy):
+    field = "created_at"
+
+
+class UpdatedDateRangeFilterStrategy(DateRangeFilterStrategy):
+    field = "updated_at"
+
+
+class ModifiedSinceFilterStrategy(UpdatedDateRangeFilterStrategy):
+    def __init__(self, since: datetime):
+        super().__init__(start=since)
+
+
+class ExpressionFilterStrategy(FilterStrategy):
+    """Filters with a parsed expression, e.g. ``status IN (todo, review) OR assignee = alex``"""
+
+    def __init__(self, expression: Union[str, Expression]):
+        self.expression = parse_expression(expression) if isinstance(expression, str) else expression
+
+    def filter(self, tasks: List[Task]) -> List[Task]:
+        return self.expression.filter(tasks)
+
+    def to_expression(self) -> Expression:
+        return self.expression
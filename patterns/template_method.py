@@ -88,6 +88,25 @@ class AssigneeReportGenerator(ReportGenerator):
         return "\n".join(report)
 
 
+class IndexedAssigneeReportGenerator(AssigneeReportGenerator):
+    """Assignee report read from TaskService's per-assignee index.
+
+    generate_report(tasks) still reports on the tasks it is given; generate_indexed_report()
+    is the entry point that needs no task list at all.
+    """
+
+    def __init__(self, task_service):
+        self.task_service = task_service
+
+    def generate_indexed_report(self) -> str:
+        return self.format_report({
+            "assignee_tasks": {
+                assignee: self.task_service.get_tasks_for_assignee(assignee)
+                for assignee in self.task_service.get_assignees()
+            }
+        })
+
+
 class PriorityReportGenerator(ReportGenerator):
     def filter_tasks(self, tasks: List[Task]) -> List[Task]:
         return tasks  # No filtering
@@ -131,3 +150,64 @@ class PriorityReportGenerator(ReportGenerator):
                     report.append(f"  - Task #{task.id}: {task.title} {status_str} {assignee_str}")
 
         return "\n".join(report)
+
+
+class FlowMetricsReportGenerator(ReportGenerator):
+    """Reads TaskService's incrementally maintained flow metrics instead of scanning tasks"""
+
+    def __init__(self, flow_metrics, days: int = 7):
+        self.flow_metrics = flow_metrics
+        self.days = days
+
+    def generate_indexed_report(self) -> str:
+        return self.generate_report([])
+
+    def filter_tasks(self, tasks: List[Task]) -> List[Task]:
+        return []  # Aggregates are already maintained, nothing to scan
+
+    def collect_data(self, tasks: List[Task]) -> Dict[str, Any]:
+        return {
+            "overall": self.flow_metrics.overall,
+            "by_assignee": dict(self.flow_metrics.by_assignee),
+            "by_priority": dict(self.flow_metrics.by_priority)
+        }
+
+    def format_report(self, data: Dict[str, Any]) -> str:
+        report = [
+            "=== FLOW METRICS REPORT ===",
+            f"Overall: {self._format_stats(data['overall'])}"
+        ]
+
+        report.append("\nBy assignee:")
+        for assignee, stats in sorted(data["by_assignee"].items(), key=lambda item: item[0] or ""):
+            report.append(f"  {assignee or 'Unassigned'}: {self._format_stats(stats)}")
+
+        report.append("\nBy priority:")
+        for priority in [TaskPriority.CRITICAL, TaskPriority.HIGH, TaskPriority.MEDIUM, TaskPriority.LOW]:
+            if priority in data["by_priority"]:
+                report.append(f"  {priority.value}: {self._format_stats(data['by_priority'][priority])}")
+
+        return "\n".join(report)
+
+    def _format_stats(self, stats) -> str:
+        throughput = stats.throughput(self.days)
+        parts = [
+            f"WIP {stats.wip}",
+            f"throughput {throughput} in {self.days}d ({throughput / self.days:.1f}/day)"
+        ]
+        if stats.cycle_time.count:
+            percentiles = ", ".join(
+                f"p{int(q * 100)} {_format_duration(stats.cycle_time.quantile(q))}" for q in (0.5, 0.85, 0.95)
+            )
+            parts.append(f"cycle time {percentiles}")
+        return " | ".join(parts)
+
+
+def _format_duration(seconds: float) -> str:
+    if seconds < 60:
+        return f"{seconds:.0f}s"
+    if seconds < 3600:
+        return f"{seconds / 60:.0f}m"
+    if seconds < 86400:
+        return f"{seconds / 3600:.1f}h"
+    return f"{seconds / 86400:.1f}d"
@@ -0,0 +1,82 @@
+from bisect import bisect_left, insort
+from typing import Any, Dict, List, Optional
+from models.task import Task, TaskStatus, TaskPriority
+
+
+class AssigneeWorkload:
+    def __init__(self):
+        self.task_ids: List[int] = []
+        self.status_counts: Dict[TaskStatus, int] = {status: 0 for status in TaskStatus}
+        self.priority_counts: Dict[TaskPriority, int] = {priority: 0 for priority in TaskPriority}
+
+    @property
+    def total(self) -> int:
+        return len(self.task_ids)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "total": self.total,
+            "status_counts": {status.name: count for status, count in self.status_counts.items()},
+            "priority_counts": {priority.name: count for priority, count in self.priority_counts.items()}
+        }
+
+
+class AssigneeIndex:
+    """Per-assignee task ids in id order plus status and priority counters; None holds unassigned tasks"""
+
+    def __init__(self):
+        self._workloads: Dict[Optional[str], AssigneeWorkload] = {}
+
+    def add(self, task: Task) -> None:
+        self._add(task.assignee, task.id, task.status, task.priority)
+
+    def remove(self, task: Task) -> None:
+        self._remove(task.assignee, task.id, task.status, task.priority)
+
+    def assignee_changed(self, task: Task, old_assignee: Optional[str]) -> None:
+        if old_assignee != task.assignee:
+            self._remove(old_assignee, task.id, task.status, task.priority)
+            self.add(task)
+
+    def status_changed(self, task: Task, old_status: TaskStatus) -> None:
+        workload = self._workloads.get(task.assignee)
+        if workload and old_status != task.status:
+            workload.status_counts[old_status] -= 1
+            workload.status_counts[task.status] += 1
+
+    def workload(self, assignee: Optional[str]) -> Optional[AssigneeWorkload]:
+        return self._workloads.get(assignee)
+
+    def task_ids(self, assignee: Optional[str]) -> List[int]:
+        workload = self._workloads.get(assignee)
+        return list(workload.task_ids) if workload else []
+
+    def assignees(self) -> List[str]:
+        return sorted(assignee for assignee in self._workloads if assignee)
+
+    def _add(self, assignee: Optional[str], task_id: int, status: TaskStatus, priority: TaskPriority) -> None:
+        workload = self._workloads.get(assignee)
+        if workload is None:
+            workload = self._workloads[assignee] = AssigneeWorkload()
+
+        # New tasks get the highest id so far, so this is nearly always an append
+        if not workload.task_ids or workload.task_ids[-1] < task_id:
+            workload.task_ids.append(task_id)
+        else:
+            insort(workload.task_ids, task_id)
+        workload.status_counts[status] += 1
+        workload.priority_counts[priority] += 1
+
+    def _remove(self, assignee: Optional[str], task_id: int, status: TaskStatus, priority: TaskPriority) -> None:
+        workload = self._workloads.get(assignee)
+        if workload is None:
+            return
+
+        idx = bisect_left(workload.task_ids, task_id)
+        if idx < len(workload.task_ids) and workload.task_ids[idx] == task_id:
+            del workload.task_ids[idx]
+            workload.status_counts[status] -= 1
+            workload.priority_counts[priority] -= 1
+
+        if not workload.task_ids:
+            del self._workloads[assignee]
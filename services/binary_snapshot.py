@@ -0,0 +1,266 @@
+import mmap
+import struct
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional
+from models.task import Task, TaskStatus, TaskPriority
+
+# Layout (little-endian):
+#   header | task records (sorted by id) | comment records | string offsets | string data
+# Task records point into the string table by index and own a contiguous run of comment records.
+MAGIC = b"TMPSSNAP"
+FORMAT_VERSION = 1
+
+HEADER = struct.Struct("<8sHHIIIQQQQ")
+# id, title, description, assignee (-1 = unassigned), status, priority, created, updated,
+# first comment, comment count
+TASK_RECORD = struct.Struct("<QIIiBBxxqqII")
+# author, comment text, timestamp
+COMMENT_RECORD = struct.Struct("<IIq")
+STRING_OFFSETS = struct.Struct("<QQ")
+# The string index holds string_count + 1 offsets into the string data
+_OFFSET_SIZE = struct.calcsize("<Q")
+
+_STATUSES = list(TaskStatus)
+_PRIORITIES = list(TaskPriority)
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _encode_time(value: datetime) -> int:
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def _decode_time(value: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=value)
+
+
+def is_binary_snapshot(path: str) -> bool:
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+class BinarySnapshotWriter:
+    def write(self, tasks: Iterable[Task], path: str) -> int:
+        strings: Dict[str, int] = {}
+        string_list: List[str] = []
+        comments = bytearray()
+        comment_count = 0
+        task_count = 0
+
+        def intern(value: str) -> int:
+            idx = strings.get(value)
+            if idx is None:
+                idx = strings[value] = len(string_list)
+                string_list.append(value)
+            return idx
+
+        with open(path, "wb") as f:
+            f.write(bytes(HEADER.size))
+            tasks_offset = HEADER.size
+
+            for task in sorted(tasks, key=lambda t: t.id):
+                first_comment = comment_count
+                for comment in task.comments:
+                    comments += COMMENT_RECORD.pack(
+                        intern(comment["author"]),
+                        intern(comment["comment"]),
+                        _encode_time(comment["timestamp"])
+                    )
+                    comment_count += 1
+
+                f.write(TASK_RECORD.pack(
+                    task.id,
+                    intern(task.title),
+                    intern(task.description),
+                    intern(task.assignee) if task.assignee is not None else -1,
+                    _STATUSES.index(task.status),
+                    _PRIORITIES.index(task.priority),
+                    _encode_time(task.created_at),
+                    _encode_time(task.updated_at),
+                    first_comment,
+                    len(task.comments)
+                ))
+                task_count += 1
+
+            comments_offset = f.tell()
+            f.write(comments)
+
+            encoded = [value.encode("utf-8") for value in string_list]
+            string_index_offset = f.tell()
+            position = 0
+            offsets = [0]
+            for data in encoded:
+                position += len(data)
+                offsets.append(position)
+            f.write(struct.pack(f"<{len(offsets)}Q", *offsets))
+
+            string_data_offset = f.tell()
+            for data in encoded:
+                f.write(data)
+
+            f.seek(0)
+            f.write(HEADER.pack(MAGIC, FORMAT_VERSION, 0, task_count, comment_count, len(string_list),
+                                tasks_offset, comments_offset, string_index_offset, string_data_offset))
+        return task_count
+
+
+class BinarySnapshot:
+    """Read-only, memory-mapped view of a snapshot; records are decoded only when accessed.
+
+    Behaves as a sequence of tasks ordered by id, so it can be handed directly to
+    ReportService.generate_report or to filter strategies.
+    """
+
+    def __init__(self, path: str):
+        self._file = open(path, "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"'{path}' is not a binary snapshot")
+
+        if len(self._mm) < HEADER.size or self._mm[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"'{path}' is not a binary snapshot")
+
+        (_, version, _, self._task_count, self._comment_count, self._string_count,
+         self._tasks_offset, self._comments_offset, self._string_index_offset,
+         self._string_data_offset) = HEADER.unpack_from(self._mm, 0)
+        if version != FORMAT_VERSION:
+            self.close()
+            raise ValueError(f"Unsupported snapshot version: {version}")
+        if max(self._tasks_offset + self._task_count * TASK_RECORD.size,
+               self._comments_offset + self._comment_count * COMMENT_RECORD.size,
+               self._string_index_offset + (self._string_count + 1) * _OFFSET_SIZE,
+               self._string_data_offset) > len(self._mm):
+            self.close()
+            raise ValueError(f"'{path}' is truncated")
+
+        # Assignee names and other repeated strings are decoded once
+        self.string = lru_cache(maxsize=4096)(self._read_string)
+
+    def __len__(self) -> int:
+        return self._task_count
+
+    def __getitem__(self, idx: int) -> "MappedTask":
+        if idx < 0:
+            idx += self._task_count
+        if not 0 <= idx < self._task_count:
+            raise IndexError("snapshot index out of range")
+        return MappedTask(self, self._tasks_offset + idx * TASK_RECORD.size)
+
+    def __iter__(self) -> Iterator["MappedTask"]:
+        for offset in range(self._tasks_offset, self._tasks_offset + self._task_count * TASK_RECORD.size,
+                            TASK_RECORD.size):
+            yield MappedTask(self, offset)
+
+    def __enter__(self) -> "BinarySnapshot":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if not self._mm.closed:
+            self._mm.close()
+        self._file.close()
+
+    def get_task(self, task_id: int) -> Optional["MappedTask"]:
+        # Records are sorted by id, and the id is the first field of each record
+        lo, hi = 0, self._task_count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            current = struct.unpack_from("<Q", self._mm, self._tasks_offset + mid * TASK_RECORD.size)[0]
+            if current < task_id:
+                lo = mid + 1
+            elif current > task_id:
+                hi = mid
+            else:
+                return self[mid]
+        return None
+
+    def load_into(self, task_service) -> int:
+        return task_service.load_tasks(task.to_task() for task in self)
+
+    def record(self, offset: int) -> tuple:
+        return TASK_RECORD.unpack_from(self._mm, offset)
+
+    def comments(self, first: int, count: int) -> List[dict]:
+        result = []
+        offset = self._comments_offset + first * COMMENT_RECORD.size
+        for _ in range(count):
+            author, text, timestamp = COMMENT_RECORD.unpack_from(self._mm, offset)
+            result.append({
+                "comment": self.string(text),
+                "author": self.string(author),
+                "timestamp": _decode_time(timestamp)
+            })
+            offset += COMMENT_RECORD.size
+        return result
+
+    def _read_string(self, idx: int) -> str:
+        start, end = STRING_OFFSETS.unpack_from(self._mm, self._string_index_offset + idx * _OFFSET_SIZE)
+        return self._mm[self._string_data_offset + start:self._string_data_offset + end].decode("utf-8")
+
+
+class MappedTask(Task):
+    """Task backed by a snapshot record; fields are decoded from the mapping on first use"""
+
+    __slots__ = ("_snapshot", "_offset", "_record")
+
+    def __init__(self, snapshot: BinarySnapshot, offset: int):
+        self._snapshot = snapshot
+        self._offset = offset
+        self._record = None
+
+    @property
+    def _fields(self) -> tuple:
+        if self._record is None:
+            self._record = self._snapshot.record(self._offset)
+        return self._record
+
+    @property
+    def id(self) -> int:
+        return self._fields[0]
+
+    @property
+    def title(self) -> str:
+        return self._snapshot.string(self._fields[1])
+
+    @property
+    def description(self) -> str:
+        return self._snapshot.string(self._fields[2])
+
+    @property
+    def assignee(self) -> Optional[str]:
+        idx = self._fields[3]
+        return self._snapshot.string(idx) if idx >= 0 else None
+
+    @property
+    def status(self) -> TaskStatus:
+        return _STATUSES[self._fields[4]]
+
+    @property
+    def priority(self) -> TaskPriority:
+        return _PRIORITIES[self._fields[5]]
+
+    @property
+    def created_at(self) -> datetime:
+        return _decode_time(self._fields[6])
+
+    @property
+    def updated_at(self) -> datetime:
+        return _decode_time(self._fields[7])
+
+    @property
+    def comments(self) -> List[dict]:
+        return self._snapshot.comments(self._fields[8], self._fields[9])
+
+    def to_task(self) -> Task:
+        task = Task(self.id, self.title, self.description, self.assignee, self.priority)
+        task.status = self.status
+        task.created_at = self.created_at
+        task.updated_at = self.updated_at
+        task.comments = self.comments
+        return task
@@ -0,0 +1,98 @@
+from collections import deque
+from itertools import islice
+from typing import Any, Deque, Dict, List, Optional
+from models.task import Task
+
+
+class Change:
+    __slots__ = ("seq", "task_id", "event_type", "data")
+
+    def __init__(self, seq: int, task_id: int, event_type: str, data: Optional[Dict[str, Any]]):
+        self.seq = seq
+        self.task_id = task_id
+        self.event_type = event_type
+        self.data = data
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "seq": self.seq,
+            "task_id": self.task_id,
+            "event": self.event_type,
+            "data": self.data
+        }
+
+
+class ChangeSet:
+    def __init__(self, changes: List[Change], latest_seq: int, resync_required: bool = False):
+        self.changes = changes
+        self.latest_seq = latest_seq
+        self.resync_required = resync_required
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "latest_seq": self.latest_seq,
+            "resync_required": self.resync_required,
+            "changes": [change.to_dict() for change in self.changes]
+        }
+
+
+class ChangeFeed:
+    """Bounded log of task mutations numbered with a global, gap-free sequence"""
+
+    def __init__(self, capacity: int = 10000):
+        if capacity < 1:
+            raise ValueError(f"Change log capacity must be at least 1, got {capacity}")
+        self._changes: Deque[Change] = deque(maxlen=capacity)
+        self._seq = 0
+        # Highest sequence number no longer available; callers older than this must resync
+        self._floor = 0
+
+    @property
+    def latest_seq(self) -> int:
+        return self._seq
+
+    def record(self, task: Task, event_type: str) -> Change:
+        if len(self._changes) == self._changes.maxlen:
+            self._floor = self._changes[0].seq
+
+        self._seq += 1
+        change = Change(self._seq, task.id, event_type, self._delta(task, event_type))
+        self._changes.append(change)
+        return change
+
+    def reset(self) -> None:
+        """Drop the log, e.g. after a bulk load that bypassed it, forcing every client to resync"""
+        self._changes.clear()
+        # Consume a sequence number for the reset itself so even fully caught-up clients fall behind it
+        self._seq += 1
+        self._floor = self._seq
+
+    def changes_since(self, seq: int) -> ChangeSet:
+        if seq < self._floor or seq > self._seq:
+            return ChangeSet([], self._seq, resync_required=True)
+        if not self._changes or seq >= self._seq:
+            return ChangeSet([], self._seq)
+
+        # Sequence numbers are contiguous, so the offset into the deque is direct
+        start = seq - self._changes[0].seq + 1
+        return ChangeSet(list(islice(self._changes, start, None)), self._seq)
+
+    @staticmethod
+    def _delta(task: Task, event_type: str) -> Optional[Dict[str, Any]]:
+        if event_type == "deleted":
+            return None
+        if event_type == "status_changed":
+            return {"status": task.status.name, "updated_at": task.updated_at.isoformat()}
+        if event_type == "assignee_changed":
+            return {"assignee": task.assignee, "updated_at": task.updated_at.isoformat()}
+        if event_type == "comment_added":
+            comment = task.comments[-1]
+            return {
+                "comment": {
+                    "comment": comment["comment"],
+                    "author": comment["author"],
+                    "timestamp": comment["timestamp"].isoformat()
+                },
+                "updated_at": task.updated_at.isoformat()
+            }
+        return task.to_dict()
@@ -0,0 +1,120 @@
+import sys
+import tracemalloc
+import types
+from array import array
+from collections import deque
+from enum import Enum
+from typing import Any, Dict, List, Optional, Set
+
+# Shared, effectively immortal objects that shouldn't be charged to whoever references them
+_SKIP_TYPES = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, types.MethodType,
+               types.CodeType, Enum)
+_LEAF_TYPES = (str, bytes, bytearray, int, float, bool, complex, array, type(None))
+
+
+def deep_sizeof(root: Any, seen: Optional[Set[int]] = None) -> int:
+    """Approximate bytes reachable from root; objects whose id is already in ``seen`` are not counted again"""
+    seen = set() if seen is None else seen
+    size = 0
+    stack = [root]
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, _SKIP_TYPES):
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+
+        if isinstance(obj, _LEAF_TYPES):
+            continue
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset, deque)):
+            stack.extend(obj)
+        else:
+            attributes = getattr(obj, "__dict__", None)
+            if isinstance(attributes, dict):
+                stack.append(attributes)
+            for cls in type(obj).__mro__:
+                slots = cls.__dict__.get("__slots__", ())
+                for slot in (slots,) if isinstance(slots, str) else slots:
+                    if slot != "__dict__" and hasattr(obj, slot):
+                        stack.append(getattr(obj, slot))
+    return size
+
+
+class MemoryReport:
+    def __init__(self, subsystems: Dict[str, int], task_count: int,
+                 snapshot: Optional[tracemalloc.Snapshot] = None, top: int = 0):
+        self.subsystems = subsystems
+        self.task_count = task_count
+        self.snapshot = snapshot
+        self.traced = tracemalloc.get_traced_memory() if tracemalloc.is_tracing() else None
+        self.top_allocations = self._top_sites(top) if snapshot and top else []
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(self.subsystems.values())
+
+    @property
+    def bytes_per_task(self) -> float:
+        task_bytes = self.subsystems.get("tasks", 0) + self.subsystems.get("comments", 0)
+        return task_bytes / self.task_count if self.task_count else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "subsystems": self.subsystems,
+            "total_bytes": self.total_bytes,
+            "task_count": self.task_count,
+            "bytes_per_task": round(self.bytes_per_task, 1),
+            "traced": {"current": self.traced[0], "peak": self.traced[1]} if self.traced else None,
+            "top_allocations": self.top_allocations
+        }
+
+    def _top_sites(self, top: int) -> List[Dict[str, Any]]:
+        return [
+            {"site": str(stat.traceback), "size": stat.size, "count": stat.count}
+            for stat in self.snapshot.statistics("lineno")[:top]
+        ]
+
+
+class MemoryDiagnostics:
+    """Attributes memory to named subsystems by walking their object graphs.
+
+    ``roots`` maps a subsystem name to the object(s) it owns. Roots are measured in order with a
+    shared seen-set, so an object reachable from several subsystems is charged to the first one.
+    Top allocation sites and tracemalloc figures are only available while tracemalloc is tracing.
+    """
+
+    def __init__(self, roots: Dict[str, Any], exclude: Optional[List[Any]] = None, task_count: int = 0):
+        self.roots = roots
+        self.exclude = exclude or []
+        self.task_count = task_count
+
+    @staticmethod
+    def start_tracing(frames: int = 1) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(frames)
+
+    def take_report(self, top: int = 0) -> MemoryReport:
+        # Snapshot first so the walk's own bookkeeping doesn't show up as a top allocation site
+        snapshot = tracemalloc.take_snapshot() if tracemalloc.is_tracing() else None
+        seen = {id(obj) for obj in self.exclude}
+        subsystems = {name: deep_sizeof(root, seen) for name, root in self.roots.items()}
+        return MemoryReport(subsystems, self.task_count, snapshot, top)
+
+    @staticmethod
+    def compare(before: MemoryReport, after: MemoryReport, top: int = 10) -> Dict[str, Any]:
+        names = list(dict.fromkeys([*before.subsystems, *after.subsystems]))
+        growth = {
+            "subsystems": {name: after.subsystems.get(name, 0) - before.subsystems.get(name, 0) for name in names},
+            "total_bytes": after.total_bytes - before.total_bytes,
+            "task_count": after.task_count - before.task_count,
+            "top_growth": []
+        }
+        if before.snapshot and after.snapshot and top:
+            growth["top_growth"] = [
+                {"site": str(stat.traceback), "size_diff": stat.size_diff, "count_diff": stat.count_diff}
+                for stat in after.snapshot.compare_to(before.snapshot, "lineno")[:top]
+            ]
+        return growth
@@ -0,0 +1,168 @@
+import gzip
+import json
+import os
+import shutil
+import threading
+from typing import Any, Dict, Iterator, List, Optional
+
+
+class EventLogWriter:
+    """Appends JSON Lines records to a file through an in-memory buffer.
+
+    The buffer is written out by a background thread every ``flush_interval`` seconds, or as
+    soon as it reaches ``max_buffer_bytes``, when ``write`` wakes that thread instead of doing
+    the I/O itself. When the file grows past ``max_file_bytes`` the same thread rotates it to
+    ``<path>.1`` (optionally gzip-compressed) and shifts older backups up to ``backup_count``.
+    Without a flush interval there is no thread and full buffers are written by the caller.
+    """
+
+    def __init__(self, path: str, max_buffer_bytes: int = 64 * 1024, flush_interval: Optional[float] = 1.0,
+                 max_file_bytes: int = 10 * 1024 * 1024, backup_count: int = 5, compress: bool = False):
+        self.path = path
+        self.max_buffer_bytes = max_buffer_bytes
+        self.max_file_bytes = max_file_bytes
+        self.backup_count = backup_count
+        self.compress = compress
+
+        self._buffer: List[str] = []
+        self._buffered_bytes = 0
+        # _lock only guards the buffer; _io_lock serialises file writes and rotation
+        self._lock = threading.Lock()
+        self._io_lock = threading.Lock()
+        self._file = open(path, "a", encoding="utf-8")
+        self._stopped = threading.Event()
+        self._wake = threading.Event()
+        self._flusher = None
+
+        if flush_interval:
+            self._flusher = threading.Thread(target=self._flush_periodically, args=(flush_interval,),
+                                             name="event-log-flusher", daemon=True)
+            self._flusher.start()
+
+    def write(self, record: Dict[str, Any]) -> None:
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        with self._lock:
+            self._buffer.append(line)
+            self._buffered_bytes += len(line)
+            full = self._buffered_bytes >= self.max_buffer_bytes
+
+        if full:
+            if self._flusher:
+                self._wake.set()
+            else:
+                self.flush()
+
+    def flush(self) -> None:
+        with self._io_lock:
+            if not self._file.closed:
+                self._flush_locked()
+
+    def close(self) -> None:
+        self._stopped.set()
+        self._wake.set()
+        if self._flusher:
+            self._flusher.join()
+        with self._io_lock:
+            if not self._file.closed:
+                self._flush_locked()
+                self._file.close()
+
+    def __enter__(self) -> "EventLogWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _flush_periodically(self, interval: float) -> None:
+        while not self._stopped.is_set():
+            self._wake.wait(interval)
+            self._wake.clear()
+            self.flush()
+
+    def _flush_locked(self) -> None:
+        # Called with _io_lock held; the buffer is swapped out so writers never wait on the disk
+        with self._lock:
+            lines, self._buffer = self._buffer, []
+            self._buffered_bytes = 0
+
+        if lines:
+            self._file.write("".join(lines))
+            self._file.flush()
+
+        if self.max_file_bytes and self._file.tell() >= self.max_file_bytes:
+            self._rotate_locked()
+
+    def _rotate_locked(self) -> None:
+        self._file.close()
+
+        if self.backup_count > 0:
+            oldest = _existing_backup(self.path, self.backup_count)
+            if oldest:
+                os.remove(oldest)
+            for idx in range(self.backup_count - 1, 0, -1):
+                source = _existing_backup(self.path, idx)
+                if source:
+                    suffix = ".gz" if source.endswith(".gz") else ""
+                    os.replace(source, f"{self.path}.{idx + 1}{suffix}")
+
+            if self.compress:
+                with open(self.path, "rb") as src, gzip.open(f"{self.path}.1.gz", "wb") as dst:
+                    shutil.copyfileobj(src, dst)
+                os.remove(self.path)
+            else:
+                os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+
+        self._file = open(self.path, "a", encoding="utf-8")
+
+
+class EventLogReader:
+    """Reads records written by EventLogWriter across rotated and compressed files, oldest first"""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def files(self) -> List[str]:
+        backups = []
+        idx = 1
+        while True:
+            backup = _existing_backup(self.path, idx)
+            if not backup:
+                break
+            backups.append(backup)
+            idx += 1
+
+        files = list(reversed(backups))
+        if os.path.exists(self.path):
+            files.append(self.path)
+        return files
+
+    def read(self, task_id: Optional[int] = None, event_type: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        # Cheap substring checks reject most lines before paying for json.loads
+        task_marker = f'"task_id":{task_id},' if task_id is not None else None
+        event_marker = json.dumps(event_type) if event_type is not None else None
+
+        for filename in self.files():
+            opener = gzip.open if filename.endswith(".gz") else open
+            with opener(filename, "rt", encoding="utf-8") as f:
+                for line in f:
+                    if task_marker and task_marker not in line:
+                        continue
+                    if event_marker and event_marker not in line:
+                        continue
+
+                    record = json.loads(line)
+                    if task_id is not None and record.get("task_id") != task_id:
+                        continue
+                    if event_type is not None and record.get("event") != event_type \
+                            and event_type not in record.get("events", ()):
+                        continue
+                    yield record
+
+
+def _existing_backup(path: str, idx: int) -> Optional[str]:
+    for candidate in (f"{path}.{idx}", f"{path}.{idx}.gz"):
+        if os.path.exists(candidate):
+            return candidate
+    return None
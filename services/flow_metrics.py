@@ -0,0 +1,136 @@
+import math
+from array import array
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from models.task import Task, TaskStatus, TaskPriority
+
+WIP_STATUSES = (TaskStatus.IN_PROGRESS, TaskStatus.REVIEW)
+
+_STATUSES = list(TaskStatus)
+
+
+class TransitionLog:
+    """Append-only status history per task, kept as two compact parallel arrays"""
+
+    def __init__(self):
+        self._times: Dict[int, array] = {}
+        self._statuses: Dict[int, array] = {}
+
+    def __len__(self) -> int:
+        return sum(len(times) for times in self._times.values())
+
+    def record(self, task_id: int, status: TaskStatus, at: datetime) -> None:
+        if task_id not in self._times:
+            self._times[task_id] = array("d")
+            self._statuses[task_id] = array("B")
+        self._times[task_id].append(at.timestamp())
+        self._statuses[task_id].append(_STATUSES.index(status))
+
+    def history(self, task_id: int) -> List[Tuple[datetime, TaskStatus]]:
+        times = self._times.get(task_id, ())
+        statuses = self._statuses.get(task_id, ())
+        return [(datetime.fromtimestamp(at), _STATUSES[status]) for at, status in zip(times, statuses)]
+
+    def first_entry(self, task_id: int, status: TaskStatus) -> Optional[datetime]:
+        code = _STATUSES.index(status)
+        statuses = self._statuses.get(task_id)
+        if statuses is None or code not in statuses:
+            return None
+        return datetime.fromtimestamp(self._times[task_id][statuses.index(code)])
+
+
+class QuantileSketch:
+    """Streaming quantiles with bounded relative error using logarithmic buckets (DDSketch-style)"""
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._buckets: Dict[int, int] = defaultdict(int)
+        self._zero_count = 0
+        self.count = 0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        if value <= 0:
+            self._zero_count += 1
+        else:
+            self._buckets[math.ceil(math.log(value) / self._log_gamma)] += 1
+
+    def quantile(self, q: float) -> Optional[float]:
+        if not self.count:
+            return None
+
+        rank = q * (self.count - 1)
+        seen = self._zero_count
+        if rank < seen:
+            return 0.0
+        for key in sorted(self._buckets):
+            seen += self._buckets[key]
+            if rank < seen:
+                return 2 * self._gamma ** key / (self._gamma + 1)
+        return 2 * self._gamma ** max(self._buckets) / (self._gamma + 1)
+
+
+class FlowStats:
+    def __init__(self):
+        self.wip = 0
+        self.completed_by_day: Dict[date, int] = defaultdict(int)
+        self.cycle_time = QuantileSketch()
+
+    def throughput(self, days: int = 7, today: Optional[date] = None) -> int:
+        today = today or date.today()
+        return sum(self.completed_by_day.get(today - timedelta(days=offset), 0) for offset in range(days))
+
+
+class FlowMetrics:
+    """Incrementally maintained WIP, throughput and cycle-time aggregates, overall and per assignee/priority.
+
+    Cycle time runs from a task's first move to In Progress until it reaches Done. Completions are
+    counted when they happen and are not withdrawn if a task is later reopened.
+    """
+
+    def __init__(self):
+        self.transitions = TransitionLog()
+        self.overall = FlowStats()
+        self.by_assignee: Dict[Optional[str], FlowStats] = defaultdict(FlowStats)
+        self.by_priority: Dict[TaskPriority, FlowStats] = defaultdict(FlowStats)
+
+    def on_created(self, task: Task) -> None:
+        self.transitions.record(task.id, task.status, task.updated_at)
+        if task.status in WIP_STATUSES:
+            self._add_wip(task, 1)
+
+    def on_status_changed(self, task: Task, old_status: TaskStatus) -> None:
+        self.transitions.record(task.id, task.status, task.updated_at)
+        if old_status == task.status:
+            return
+
+        if old_status in WIP_STATUSES:
+            self._add_wip(task, -1)
+        if task.status in WIP_STATUSES:
+            self._add_wip(task, 1)
+
+        if task.status == TaskStatus.DONE:
+            started = self.transitions.first_entry(task.id, TaskStatus.IN_PROGRESS)
+            cycle_time = (task.updated_at - started).total_seconds() if started else None
+            for stats in self._stats_for(task):
+                stats.completed_by_day[task.updated_at.date()] += 1
+                if cycle_time is not None:
+                    stats.cycle_time.add(cycle_time)
+
+    def on_assignee_changed(self, task: Task, old_assignee: Optional[str]) -> None:
+        if task.status in WIP_STATUSES and old_assignee != task.assignee:
+            self.by_assignee[old_assignee].wip -= 1
+            self.by_assignee[task.assignee].wip += 1
+
+    def on_deleted(self, task: Task) -> None:
+        if task.status in WIP_STATUSES:
+            self._add_wip(task, -1)
+
+    def _add_wip(self, task: Task, delta: int) -> None:
+        for stats in self._stats_for(task):
+            stats.wip += delta
+
+    def _stats_for(self, task: Task) -> Tuple[FlowStats, FlowStats, FlowStats]:
+        return self.overall, self.by_assignee[task.assignee], self.by_priority[task.priority]
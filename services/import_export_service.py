@@ -0,0 +1,156 @@
+import csv
+import json
+import time
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+from models.task import Task
+
+TASK_CSV_FIELDS = ["id", "title", "description", "status", "priority", "assignee", "created_at", "updated_at"]
+COMMENT_CSV_FIELDS = ["task_id", "author", "comment", "timestamp"]
+
+
+class TransferStats:
+    def __init__(self):
+        self.rows = 0
+        self.skipped = 0
+        self._started = time.perf_counter()
+        self.elapsed = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed if self.elapsed else 0.0
+
+    def tick(self, rows: int, skipped: int = 0) -> None:
+        self.rows += rows
+        self.skipped += skipped
+        self.elapsed = time.perf_counter() - self._started
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "rows": self.rows,
+            "skipped": self.skipped,
+            "elapsed": round(self.elapsed, 3),
+            "rows_per_second": round(self.rows_per_second, 1)
+        }
+
+
+class ImportExportService:
+    """Streams tasks and comments between TaskService and JSON Lines / CSV files in fixed-size chunks.
+
+    The format is taken from the file extension (.jsonl/.ndjson or .csv) unless given explicitly.
+    JSON Lines task records carry their comments inline; CSV keeps comments in a separate file.
+    """
+
+    FORMATS = ("jsonl", "csv")
+
+    def __init__(self, chunk_size: int = 10000, progress: Optional[Callable[[TransferStats], None]] = None):
+        self.chunk_size = chunk_size
+        self.progress = progress
+
+    def import_tasks(self, task_service, path: str, format: Optional[str] = None,
+                     notify: bool = False, upsert: bool = False) -> TransferStats:
+        """Rows whose id already exists are counted as skipped unless ``upsert`` replaces them"""
+        format = self._resolve_format(path, format)
+        with open(path, newline="", encoding="utf-8") as f:
+            records = self._read_jsonl(f) if format == "jsonl" else self._read_task_csv(f)
+            return self._import(records,
+                                lambda chunk: len(task_service.bulk_create_tasks(chunk, notify, upsert)))
+
+    def import_comments(self, task_service, path: str, format: Optional[str] = None,
+                        notify: bool = False) -> TransferStats:
+        format = self._resolve_format(path, format)
+        with open(path, newline="", encoding="utf-8") as f:
+            records = self._read_jsonl(f) if format == "jsonl" else csv.DictReader(f)
+            return self._import(records, lambda chunk: task_service.bulk_add_comments(chunk, notify))
+
+    def export_tasks(self, tasks: Iterable[Task], path: str, format: Optional[str] = None) -> TransferStats:
+        format = self._resolve_format(path, format)
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            if format == "jsonl":
+                rows = (task.to_dict() for task in tasks)
+                return self._export(rows, lambda chunk: self._write_jsonl(f, chunk))
+
+            writer = csv.DictWriter(f, fieldnames=TASK_CSV_FIELDS, extrasaction="ignore")
+            writer.writeheader()
+            rows = (task.to_dict() for task in tasks)
+            return self._export(rows, writer.writerows)
+
+    def export_comments(self, tasks: Iterable[Task], path: str, format: Optional[str] = None) -> TransferStats:
+        format = self._resolve_format(path, format)
+        rows = (
+            {
+                "task_id": task.id,
+                "author": comment["author"],
+                "comment": comment["comment"],
+                "timestamp": comment["timestamp"].isoformat()
+            }
+            for task in tasks
+            for comment in task.comments
+        )
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            if format == "jsonl":
+                return self._export(rows, lambda chunk: self._write_jsonl(f, chunk))
+
+            writer = csv.DictWriter(f, fieldnames=COMMENT_CSV_FIELDS)
+            writer.writeheader()
+            return self._export(rows, writer.writerows)
+
+    def _import(self, records: Iterable[Dict[str, Any]], apply: Callable[[List[Dict[str, Any]]], int]) -> TransferStats:
+        stats = TransferStats()
+        for chunk in self._chunks(records):
+            applied = apply(chunk)
+            stats.tick(applied, len(chunk) - applied)
+            self._report(stats)
+        return stats
+
+    def _export(self, rows: Iterable[Dict[str, Any]], write: Callable[[List[Dict[str, Any]]], Any]) -> TransferStats:
+        stats = TransferStats()
+        for chunk in self._chunks(rows):
+            write(chunk)
+            stats.tick(len(chunk))
+            self._report(stats)
+        return stats
+
+    def _chunks(self, rows: Iterable[Dict[str, Any]]) -> Iterator[List[Dict[str, Any]]]:
+        rows = iter(rows)
+        while True:
+            chunk = list(islice(rows, self.chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+    def _report(self, stats: TransferStats) -> None:
+        if self.progress:
+            self.progress(stats)
+
+    def _resolve_format(self, path: str, format: Optional[str]) -> str:
+        if format is None:
+            lowered = path.lower()
+            if lowered.endswith((".jsonl", ".ndjson")):
+                format = "jsonl"
+            elif lowered.endswith(".csv"):
+                format = "csv"
+            else:
+                raise ValueError(f"Cannot infer format from '{path}'; pass one of: {', '.join(self.FORMATS)}")
+        if format not in self.FORMATS:
+            raise ValueError(f"Unknown format '{format}'. Expected one of: {', '.join(self.FORMATS)}")
+        return format
+
+    @staticmethod
+    def _read_jsonl(f) -> Iterator[Dict[str, Any]]:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+    @staticmethod
+    def _read_task_csv(f) -> Iterator[Dict[str, Any]]:
+        for row in csv.DictReader(f):
+            # Empty CSV cells mean "not provided" so Task.from_dict falls back to its defaults
+            record = {key: value for key, value in row.items() if value not in ("", None)}
+            if "id" in record:
+                record["id"] = int(record["id"])
+            yield record
+
+    @staticmethod
+    def _write_jsonl(f, rows: List[Dict[str, Any]]) -> None:
+        f.write("".join(json.dumps(row, separators=(",", ":")) + "\n" for row in rows))
@@ -1,20 +1,42 @@
-from typing import List, Dict
+from typing import Callable, List, Dict, Union
 from models.task import Task
 from patterns.template_method import ReportGenerator
 
 
 class ReportService:
     def __init__(self):
-        self._generators: Dict[str, ReportGenerator] = {}
+        # One entry per name in registration order; a factory is swapped for its generator in place
+        # once built, so the order (and the menu numbering based on it) never changes
+        self._generators: Dict[str, Union[ReportGenerator, Callable[[], ReportGenerator]]] = {}
 
     def register_generator(self, name: str, generator: ReportGenerator) -> None:
         self._generators[name] = generator
 
+    def register_generator_factory(self, name: str, factory: Callable[[], ReportGenerator]) -> None:
+        """Register a generator that is only built the first time its report is requested"""
+        self._generators[name] = factory
+
     def generate_report(self, name: str, tasks: List[Task]) -> str:
-        if name in self._generators:
-            return self._generators[name].generate_report(tasks)
+        generator = self._get_generator(name)
+        if generator:
+            return generator.generate_report(tasks)
         else:
             return f"Report generator '{name}' not found"
 
+    def generate_report_from(self, name: str, get_tasks: Callable[[], List[Task]]) -> str:
+        """Like generate_report, but the task list is only built for generators that need one"""
+        generator = self._get_generator(name)
+        if not generator:
+            return f"Report generator '{name}' not found"
+        if hasattr(generator, "generate_indexed_report"):
+            return generator.generate_indexed_report()
+        return generator.generate_report(get_tasks())
+
     def get_available_reports(self) -> List[str]:
-        return list(self._generators.keys())
\ No newline at end of file
+        return list(self._generators.keys())
+
+    def _get_generator(self, name: str):
+        generator = self._generators.get(name)
+        if generator is not None and not isinstance(generator, ReportGenerator):
+            generator = self._generators[name] = generator()
+        return generator
\ No newline at end of file
@@ -0,0 +1,307 @@
+import heapq
+import multiprocessing
+import os
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from models.task import Task, TaskStatus, TaskPriority
+from patterns.observer import Observer, TaskSubject
+from services.assignee_index import AssigneeWorkload
+from services.task_service import TaskService
+
+
+class _EventForwarder(Observer):
+    def __init__(self):
+        self.events = []
+        self.enabled = True
+
+    def update(self, task: Task, event_type: str) -> None:
+        if self.enabled:
+            self.events.append((task, event_type))
+
+    def drain(self) -> list:
+        events, self.events = self.events, []
+        return events
+
+
+def _create_many(service: TaskService, specs: List[Dict[str, Any]]) -> List[int]:
+    return [service.create_task(**spec).id for spec in specs]
+
+
+def _apply_many(service: TaskService, calls: List[Tuple[str, tuple]]) -> List[Tuple[bool, Any]]:
+    # One outcome per call so a failing write doesn't hide the results of the others
+    outcomes = []
+    for method, args in calls:
+        try:
+            outcomes.append((True, _dispatch(service, method, args, {})))
+        except Exception as e:
+            outcomes.append((False, e))
+    return outcomes
+
+
+def _dispatch(service: TaskService, method: str, args: tuple, kwargs: dict):
+    if method in _SHARD_METHODS:
+        return getattr(service, method)(*args, **kwargs)
+    raise AttributeError(f"Unsupported shard method '{method}'")
+
+
+_SHARD_METHODS = {
+    "create_task", "get_all_tasks", "get_task_by_id", "update_task_status", "assign_task",
+    "delete_task", "add_comment", "filter_tasks", "load_tasks", "get_tasks_created_between",
+    "get_tasks_updated_between", "get_tasks_modified_since", "bulk_create_tasks", "bulk_add_comments",
+    "get_status_history", "get_assignees", "get_assignee_workload",
+}
+
+
+def _shard_worker(connection, shard_index: int, shard_count: int, change_log_capacity: int) -> None:
+    service = TaskService(change_log_capacity, id_start=shard_index + 1, id_step=shard_count)
+    forwarder = _EventForwarder()
+    service.subject.attach(forwarder)
+
+    while True:
+        message = connection.recv()
+        if message is None:
+            break
+
+        method, args, kwargs, forwarder.enabled = message
+        try:
+            if method == "create_many":
+                result = _create_many(service, *args, **kwargs)
+            elif method == "apply_many":
+                result = _apply_many(service, *args, **kwargs)
+            else:
+                result = _dispatch(service, method, args, kwargs)
+            connection.send((True, result, forwarder.drain()))
+        except Exception as e:
+            connection.send((False, e, forwarder.drain()))
+
+    connection.close()
+
+
+class ShardedTaskService:
+    """TaskService API over N worker processes, each owning the tasks whose (id - 1) % N equals its index.
+
+    Single-task operations are routed to the owning shard; listing, filtering and date-range
+    queries are sent to every shard at once and the results merged. Observer events raised
+    inside a shard travel back with the reply and are re-published on this router's subject,
+    in order, before the call returns. The batched write methods (update_task_statuses,
+    assign_tasks, add_comments, delete_tasks) pipeline their calls: every shard receives its
+    share before any reply is read. The change feed is per shard and is not exposed here.
+    """
+
+    def __init__(self, shard_count: Optional[int] = None, change_log_capacity: int = 10000):
+        self.shard_count = shard_count or os.cpu_count() or 1
+        self.subject = TaskSubject()
+        self._next_shard = 0
+        self._processes = []
+        self._connections = []
+
+        for idx in range(self.shard_count):
+            parent_connection, child_connection = multiprocessing.Pipe()
+            process = multiprocessing.Process(
+                target=_shard_worker,
+                args=(child_connection, idx, self.shard_count, change_log_capacity),
+                name=f"task-shard-{idx}",
+                daemon=True
+            )
+            process.start()
+            child_connection.close()
+            self._processes.append(process)
+            self._connections.append(parent_connection)
+
+    def shard_for(self, task_id: int) -> int:
+        return (task_id - 1) % self.shard_count
+
+    def close(self) -> None:
+        for connection in self._connections:
+            try:
+                connection.send(None)
+                connection.close()
+            except OSError:
+                pass
+        for process in self._processes:
+            process.join()
+        self._connections = []
+        self._processes = []
+
+    def __enter__(self) -> "ShardedTaskService":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def create_task(self, title: str, description: str,
+                    assignee: Optional[str] = None,
+                    priority: TaskPriority = TaskPriority.MEDIUM) -> Task:
+        shard = self._next_shard
+        self._next_shard = (self._next_shard + 1) % self.shard_count
+        return self._call(shard, "create_task", title, description, assignee, priority)
+
+    def create_tasks(self, specs: Iterable[Dict[str, Any]]) -> List[int]:
+        """Create many tasks, spreading them round-robin so every shard works in parallel; returns the new ids"""
+        batches = [[] for _ in range(self.shard_count)]
+        for spec in specs:
+            batches[self._next_shard].append(spec)
+            self._next_shard = (self._next_shard + 1) % self.shard_count
+
+        results = self._scatter("create_many", per_shard_args=[(batch,) for batch in batches])
+        return sorted(task_id for task_ids in results for task_id in task_ids)
+
+    def load_tasks(self, tasks: Iterable[Task]) -> int:
+        batches = [[] for _ in range(self.shard_count)]
+        for task in tasks:
+            batches[self.shard_for(task.id)].append(task)
+        return sum(self._scatter("load_tasks", per_shard_args=[(batch,) for batch in batches]))
+
+    def bulk_create_tasks(self, records: Iterable[Dict[str, Any]], notify: bool = False,
+                          upsert: bool = False) -> List[int]:
+        batches = [[] for _ in range(self.shard_count)]
+        for record in records:
+            if record.get("id") is None:
+                shard = self._next_shard
+                self._next_shard = (self._next_shard + 1) % self.shard_count
+            else:
+                shard = self.shard_for(int(record["id"]))
+            batches[shard].append(record)
+
+        results = self._scatter("bulk_create_tasks", notify=notify, upsert=upsert,
+                                per_shard_args=[(batch,) for batch in batches])
+        return sorted(task_id for task_ids in results for task_id in task_ids)
+
+    def bulk_add_comments(self, records: Iterable[Dict[str, Any]], notify: bool = False) -> int:
+        batches = [[] for _ in range(self.shard_count)]
+        for record in records:
+            batches[self.shard_for(int(record["task_id"]))].append(record)
+
+        results = self._scatter("bulk_add_comments", notify=notify,
+                                per_shard_args=[(batch,) for batch in batches])
+        return sum(results)
+
+    def get_all_tasks(self) -> List[Task]:
+        return self._gather_by_id(self._scatter("get_all_tasks"))
+
+    def get_task_by_id(self, task_id: int) -> Optional[Task]:
+        return self._call(self.shard_for(task_id), "get_task_by_id", task_id)
+
+    def update_task_status(self, task_id: int, status: TaskStatus) -> Optional[Task]:
+        return self._call(self.shard_for(task_id), "update_task_status", task_id, status)
+
+    def assign_task(self, task_id: int, assignee: Optional[str]) -> Optional[Task]:
+        return self._call(self.shard_for(task_id), "assign_task", task_id, assignee)
+
+    def delete_task(self, task_id: int) -> bool:
+        return self._call(self.shard_for(task_id), "delete_task", task_id)
+
+    def add_comment(self, task_id: int, comment: str, author: str) -> Optional[Task]:
+        return self._call(self.shard_for(task_id), "add_comment", task_id, comment, author)
+
+    def update_task_statuses(self, updates: Iterable[Tuple[int, TaskStatus]]) -> List[Optional[Task]]:
+        return self._pipeline((self.shard_for(task_id), "update_task_status", (task_id, status))
+                              for task_id, status in updates)
+
+    def assign_tasks(self, assignments: Iterable[Tuple[int, Optional[str]]]) -> List[Optional[Task]]:
+        return self._pipeline((self.shard_for(task_id), "assign_task", (task_id, assignee))
+                              for task_id, assignee in assignments)
+
+    def add_comments(self, comments: Iterable[Tuple[int, str, str]]) -> List[Optional[Task]]:
+        return self._pipeline((self.shard_for(task_id), "add_comment", (task_id, comment, author))
+                              for task_id, comment, author in comments)
+
+    def delete_tasks(self, task_ids: Iterable[int]) -> List[bool]:
+        return self._pipeline((self.shard_for(task_id), "delete_task", (task_id,)) for task_id in task_ids)
+
+    def get_status_history(self, task_id: int) -> List[Tuple[datetime, TaskStatus]]:
+        return self._call(self.shard_for(task_id), "get_status_history", task_id)
+
+    def get_assignees(self) -> List[str]:
+        return sorted(set().union(*self._scatter("get_assignees")))
+
+    def get_assignee_workload(self, assignee: Optional[str]) -> Optional[AssigneeWorkload]:
+        workloads = [workload for workload in self._scatter("get_assignee_workload", assignee) if workload]
+        if not workloads:
+            return None
+
+        merged = AssigneeWorkload()
+        merged.task_ids = list(heapq.merge(*(workload.task_ids for workload in workloads)))
+        for workload in workloads:
+            for status, count in workload.status_counts.items():
+                merged.status_counts[status] += count
+            for priority, count in workload.priority_counts.items():
+                merged.priority_counts[priority] += count
+        return merged
+
+    def filter_tasks(self, filter_strategy) -> List[Task]:
+        return self._gather_by_id(self._scatter("filter_tasks", filter_strategy))
+
+    def get_tasks_created_between(self, start: Optional[datetime] = None,
+                                  end: Optional[datetime] = None) -> List[Task]:
+        results = self._scatter("get_tasks_created_between", start, end)
+        return list(heapq.merge(*results, key=lambda task: (task.created_at, task.id)))
+
+    def get_tasks_updated_between(self, start: Optional[datetime] = None,
+                                  end: Optional[datetime] = None) -> List[Task]:
+        results = self._scatter("get_tasks_updated_between", start, end)
+        return list(heapq.merge(*results, key=lambda task: (task.updated_at, task.id)))
+
+    def get_tasks_modified_since(self, since: datetime) -> List[Task]:
+        return self.get_tasks_updated_between(since, None)
+
+    def _call(self, shard: int, method: str, *args, **kwargs):
+        self._connections[shard].send((method, args, kwargs, self.subject.has_observers()))
+        return self._receive(shard)
+
+    def _pipeline(self, calls: Iterable[Tuple[int, str, tuple]]) -> list:
+        """Run (shard, method, args) calls with one message per involved shard; results keep call order"""
+        per_shard = {}
+        for position, (shard, method, args) in enumerate(calls):
+            per_shard.setdefault(shard, []).append((position, method, args))
+
+        forward_events = self.subject.has_observers()
+        for shard, shard_calls in per_shard.items():
+            batch = [(method, args) for _, method, args in shard_calls]
+            self._connections[shard].send(("apply_many", (batch,), {}, forward_events))
+
+        results, error = [None] * sum(len(shard_calls) for shard_calls in per_shard.values()), None
+        for shard, shard_calls in per_shard.items():
+            try:
+                outcomes = self._receive(shard)
+            except Exception as e:
+                error = error or e
+                continue
+            for (position, _, _), (ok, result) in zip(shard_calls, outcomes):
+                if ok:
+                    results[position] = result
+                else:
+                    error = error or result
+        if error:
+            raise error
+        return results
+
+    def _scatter(self, method: str, *args, per_shard_args=None, **kwargs) -> list:
+        # Shards only ship events back when someone here is listening
+        forward_events = self.subject.has_observers()
+        for shard, connection in enumerate(self._connections):
+            shard_args = per_shard_args[shard] if per_shard_args is not None else args
+            connection.send((method, shard_args, kwargs, forward_events))
+
+        # Collect every reply before raising so no shard is left with an unread response
+        results, error = [], None
+        for shard in range(self.shard_count):
+            try:
+                results.append(self._receive(shard))
+            except Exception as e:
+                error = error or e
+        if error:
+            raise error
+        return results
+
+    def _receive(self, shard: int):
+        ok, result, events = self._connections[shard].recv()
+        for task, event_type in events:
+            self.subject.notify(task, event_type)
+        if not ok:
+            raise result
+        return result
+
+    @staticmethod
+    def _gather_by_id(results: List[List[Task]]) -> List[Task]:
+        return sorted((task for tasks in results for task in tasks), key=lambda task: task.id)
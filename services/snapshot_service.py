@@ -0,0 +1,53 @@
+import json
+import os
+from typing import Optional
+from models.task import Task
+from services.binary_snapshot import BinarySnapshot, BinarySnapshotWriter, is_binary_snapshot
+
+
+class SnapshotService:
+    FORMAT_VERSION = 1
+    FORMATS = ("json", "binary")
+
+    def save(self, task_service, path: str, format: str = "json") -> int:
+        if format not in self.FORMATS:
+            raise ValueError(f"Unknown snapshot format '{format}'. Expected one of: {', '.join(self.FORMATS)}")
+        if format == "binary":
+            return self._save_binary(task_service, path)
+
+        tasks = task_service.get_all_tasks()
+        data = {
+            "version": self.FORMAT_VERSION,
+            "tasks": [task.to_dict() for task in tasks]
+        }
+
+        # Write to a sibling file first so a crash never leaves a truncated snapshot behind
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+        return len(tasks)
+
+    def load(self, task_service, path: str) -> int:
+        if is_binary_snapshot(path):
+            with BinarySnapshot(path) as snapshot:
+                return snapshot.load_into(task_service)
+
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+
+        version: Optional[int] = data.get("version")
+        if version != self.FORMAT_VERSION:
+            raise ValueError(f"Unsupported snapshot version: {version}")
+
+        return task_service.load_tasks(Task.from_dict(record) for record in data["tasks"])
+
+    def open_binary(self, path: str) -> BinarySnapshot:
+        """Map a binary snapshot read-only without loading it into a TaskService"""
+        return BinarySnapshot(path)
+
+    def _save_binary(self, task_service, path: str) -> int:
+        tmp_path = f"{path}.tmp"
+        count = BinarySnapshotWriter().write(task_service.get_all_tasks(), tmp_path)
+        os.replace(tmp_path, path)
+        return count
@@ -1,13 +1,28 @@
-from typing import List, Dict, Optional
-from models.task import Task, TaskStatus, TaskPriority
+from datetime import datetime
+from typing import Any, Iterable, List, Dict, Optional, Tuple
+from models.task import Task, TaskStatus, TaskPriority, parse_timestamp
 from patterns.observer import TaskSubject
+from services.assignee_index import AssigneeIndex, AssigneeWorkload
+from services.change_feed import ChangeFeed, ChangeSet
+from services.flow_metrics import FlowMetrics
+from services.time_index import TimeIndex
 
 
 class TaskService:
-    def __init__(self):
+    def __init__(self, change_log_capacity: int = 10000, id_start: int = 1, id_step: int = 1):
         self._tasks: Dict[int, Task] = {}
-        self._next_id = 1
+        # A shard owns every id_step-th id starting at id_start (see ShardedTaskService)
+        self._id_start = id_start
+        self._id_step = id_step
+        self._next_id = id_start
         self.subject = TaskSubject()
+        self.changes = ChangeFeed(change_log_capacity)
+        self._time_indexes: Dict[str, TimeIndex] = {
+            "created_at": TimeIndex(),
+            "updated_at": TimeIndex()
+        }
+        self.flow_metrics = FlowMetrics()
+        self._assignee_index = AssigneeIndex()
 
     def create_task(self, title: str, description: str,
                     assignee: Optional[str] = None,
@@ -20,12 +35,80 @@ class TaskService:
             priority=priority
         )
         self._tasks[self._next_id] = task
-        self._next_id += 1
+        self._next_id += self._id_step
+        self._index_task(task)
+        self.flow_metrics.on_created(task)
 
         # Notify observers
-        self.subject.notify(task, "created")
+        self._notify(task, "created")
         return task
 
+    def load_tasks(self, tasks: Iterable[Task]) -> int:
+        """Insert pre-built tasks (e.g. from a snapshot) without notifying observers"""
+        count = 0
+        for task in tasks:
+            self._insert_task(task)
+            count += 1
+
+        # These tasks never went through the change feed, so mirrors have to resync
+        if count:
+            self.changes.reset()
+        return count
+
+    def bulk_create_tasks(self, records: Iterable[Dict[str, Any]], notify: bool = False,
+                          upsert: bool = False) -> List[int]:
+        """Create tasks from Task.to_dict()-shaped records; records without an id get the next free one.
+
+        Records whose id already exists are skipped unless ``upsert`` is set, in which case they
+        replace the existing task. Observers are only notified per task when ``notify`` is set;
+        otherwise the change feed is reset at the end (even on error) so mirrors know to resync.
+        """
+        task_ids = []
+        try:
+            for record in records:
+                if record.get("id") is None:
+                    record = dict(record, id=self._next_id)
+                task = Task.from_dict(record)
+                replaced = task.id in self._tasks
+                if replaced and not upsert:
+                    continue
+
+                self._insert_task(task)
+                task_ids.append(task.id)
+
+                if notify:
+                    self._notify(task, "replaced" if replaced else "created")
+        finally:
+            if task_ids and not notify:
+                self.changes.reset()
+        return task_ids
+
+    def bulk_add_comments(self, records: Iterable[Dict[str, Any]], notify: bool = False) -> int:
+        """Attach historical comments ({task_id, comment, author, timestamp}); unknown tasks are skipped"""
+        count = 0
+        try:
+            for record in records:
+                task = self._tasks.get(int(record["task_id"]))
+                if not task:
+                    continue
+
+                timestamp = record.get("timestamp")
+                if timestamp:
+                    timestamp = parse_timestamp(timestamp)
+                task.comments.append({
+                    "comment": record["comment"],
+                    "author": record["author"],
+                    "timestamp": timestamp or datetime.now()
+                })
+                count += 1
+
+                if notify:
+                    self._notify(task, "comment_added")
+        finally:
+            if count and not notify:
+                self.changes.reset()
+        return count
+
     def get_all_tasks(self) -> List[Task]:
         return list(self._tasks.values())
 
@@ -36,10 +119,14 @@ class TaskService:
         task = self.get_task_by_id(task_id)
         if task:
             old_status = task.status
+            old_updated_at = task.updated_at
             task.update_status(status)
+            self._reindex_updated(task, old_updated_at)
+            self.flow_metrics.on_status_changed(task, old_status)
+            self._assignee_index.status_changed(task, old_status)
 
             # Notify observers
-            self.subject.notify(task, "status_changed")
+            self._notify(task, "status_changed")
 
             return task
         return None
@@ -48,10 +135,14 @@ class TaskService:
         task = self.get_task_by_id(task_id)
         if task:
             old_assignee = task.assignee
-            task.assignee = assignee
+            old_updated_at = task.updated_at
+            task.assign(assignee)
+            self._reindex_updated(task, old_updated_at)
+            self.flow_metrics.on_assignee_changed(task, old_assignee)
+            self._assignee_index.assignee_changed(task, old_assignee)
 
             # Notify observers
-            self.subject.notify(task, "assignee_changed")
+            self._notify(task, "assignee_changed")
 
             return task
         return None
@@ -60,9 +151,11 @@ class TaskService:
         if task_id in self._tasks:
             task = self._tasks[task_id]
             del self._tasks[task_id]
+            self._unindex_task(task)
+            self.flow_metrics.on_deleted(task)
 
             # Notify observers
-            self.subject.notify(task, "deleted")
+            self._notify(task, "deleted")
 
             return True
         return False
@@ -70,14 +163,112 @@ class TaskService:
     def add_comment(self, task_id: int, comment: str, author: str) -> Optional[Task]:
         task = self.get_task_by_id(task_id)
         if task:
+            old_updated_at = task.updated_at
             task.add_comment(comment, author)
+            self._reindex_updated(task, old_updated_at)
 
             # Notify observers
-            self.subject.notify(task, "comment_added")
+            self._notify(task, "comment_added")
 
             return task
         return None
 
+    def get_status_history(self, task_id: int) -> List[Tuple[datetime, TaskStatus]]:
+        return self.flow_metrics.transitions.history(task_id)
+
+    @property
+    def latest_sequence(self) -> int:
+        return self.changes.latest_seq
+
+    def changes_since(self, seq: int) -> ChangeSet:
+        return self.changes.changes_since(seq)
+
+    def get_tasks_created_between(self, start: Optional[datetime] = None,
+                                  end: Optional[datetime] = None) -> List[Task]:
+        return self._tasks_in_range("created_at", start, end)
+
+    def get_tasks_updated_between(self, start: Optional[datetime] = None,
+                                  end: Optional[datetime] = None) -> List[Task]:
+        return self._tasks_in_range("updated_at", start, end)
+
+    def get_tasks_modified_since(self, since: datetime) -> List[Task]:
+        return self._tasks_in_range("updated_at", since, None)
+
     def filter_tasks(self, filter_strategy) -> List[Task]:
-        tasks = self.get_all_tasks()
-        return filter_strategy.filter(tasks)
\ No newline at end of file
+        if not hasattr(filter_strategy, "to_expression"):
+            return filter_strategy.filter(self.get_all_tasks())
+
+        # One compiled predicate, applied only to the ids the indexes can't rule out.
+        # Both paths return id order, which is what ShardedTaskService merges to as well.
+        expression = filter_strategy.to_expression()
+        candidates = expression.candidates(self)
+        if candidates is None:
+            return sorted(expression.filter(self._tasks.values()), key=lambda task: task.id)
+        return expression.filter(self._tasks[task_id] for task_id in sorted(candidates))
+
+    def get_tasks_for_assignee(self, assignee: Optional[str]) -> List[Task]:
+        return [self._tasks[task_id] for task_id in self._assignee_index.task_ids(assignee)]
+
+    def get_assignee_workload(self, assignee: Optional[str]) -> Optional[AssigneeWorkload]:
+        return self._assignee_index.workload(assignee)
+
+    def get_assignees(self) -> List[str]:
+        return self._assignee_index.assignees()
+
+    def memory_components(self) -> Dict[str, Any]:
+        """Named internal structures for MemoryDiagnostics; comments come first so "tasks" excludes them"""
+        return {
+            "comments": [task.comments for task in self._tasks.values()],
+            "tasks": self._tasks,
+            "time_index": self._time_indexes,
+            "assignee_index": self._assignee_index,
+            "change_feed": self.changes,
+            "flow_metrics": self.flow_metrics,
+            "observers": self.subject
+        }
+
+    def lookup_equal(self, field: str, value) -> Optional[Iterable[int]]:
+        if field == "id":
+            return [value] if value in self._tasks else []
+        if field == "assignee":
+            return self._assignee_index.task_ids(value)
+        return None
+
+    def lookup_range(self, field: str, start: Optional[datetime], end: Optional[datetime]) -> Optional[Iterable[int]]:
+        index = self._time_indexes.get(field)
+        return index.range(start, end) if index else None
+
+    def _tasks_in_range(self, field: str, start: Optional[datetime], end: Optional[datetime]) -> List[Task]:
+        return [self._tasks[task_id] for task_id in self._time_indexes[field].range(start, end)]
+
+    def _id_after(self, task_id: int) -> int:
+        return self._id_start + ((task_id - self._id_start) // self._id_step + 1) * self._id_step
+
+    def _notify(self, task: Task, event_type: str) -> None:
+        self.changes.record(task, event_type)
+        self.subject.notify(task, event_type)
+
+    def _insert_task(self, task: Task) -> None:
+        # Index first and store last, so a task that can't be indexed never becomes visible
+        next_id = self._id_after(task.id)
+        self._index_task(task)
+        previous = self._tasks.get(task.id)
+        if previous:
+            self._unindex_task(previous)
+            self.flow_metrics.on_deleted(previous)
+        self.flow_metrics.on_created(task)
+        self._tasks[task.id] = task
+        self._next_id = max(self._next_id, next_id)
+
+    def _index_task(self, task: Task) -> None:
+        self._time_indexes["created_at"].add(task.created_at, task.id)
+        self._time_indexes["updated_at"].add(task.updated_at, task.id)
+        self._assignee_index.add(task)
+
+    def _unindex_task(self, task: Task) -> None:
+        self._time_indexes["created_at"].remove(task.created_at, task.id)
+        self._time_indexes["updated_at"].remove(task.updated_at, task.id)
+        self._assignee_index.remove(task)
+
+    def _reindex_updated(self, task: Task, old_updated_at: datetime) -> None:
+        self._time_indexes["updated_at"].move(old_updated_at, task.updated_at, task.id)
\ No newline at end of file
@@ -0,0 +1,38 @@
+from bisect import bisect_left, insort
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+
+class TimeIndex:
+    """Sorted (timestamp, task id) pairs supporting range lookups in O(log n + k)"""
+
+    def __init__(self):
+        self._entries: List[Tuple[datetime, int]] = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, timestamp: datetime, task_id: int) -> None:
+        entry = (timestamp, task_id)
+        # Timestamps are almost always "now", so appending is the common case
+        if not self._entries or self._entries[-1] <= entry:
+            self._entries.append(entry)
+        else:
+            insort(self._entries, entry)
+
+    def remove(self, timestamp: datetime, task_id: int) -> None:
+        entry = (timestamp, task_id)
+        idx = bisect_left(self._entries, entry)
+        if idx < len(self._entries) and self._entries[idx] == entry:
+            del self._entries[idx]
+
+    def move(self, old_timestamp: datetime, new_timestamp: datetime, task_id: int) -> None:
+        if old_timestamp != new_timestamp:
+            self.remove(old_timestamp, task_id)
+            self.add(new_timestamp, task_id)
+
+    def range(self, start: Optional[datetime] = None, end: Optional[datetime] = None) -> List[int]:
+        """Task ids with start <= timestamp < end, oldest first"""
+        lo = 0 if start is None else bisect_left(self._entries, (start,))
+        hi = len(self._entries) if end is None else bisect_left(self._entries, (end,))
+        return [task_id for _, task_id in self._entries[lo:hi]]
@@ -0,0 +1,52 @@
+import pytest
+
+from main import main
+from services.binary_snapshot import BinarySnapshot
+from services.snapshot_service import SnapshotService
+from services.task_service import TaskService
+
+
+@pytest.fixture
+def snapshots(tmp_path):
+    service = TaskService()
+    service.create_task("Login", "", "alex")
+    paths = {}
+    for format in ("json", "binary"):
+        paths[format] = str(tmp_path / f"tasks.{format}")
+        SnapshotService().save(service, paths[format], format)
+    return paths
+
+
+def test_rejects_files_shorter_than_the_header(tmp_path):
+    path = tmp_path / "short.snap"
+    path.write_bytes(b"TMPSSNAP\x01")
+
+    with pytest.raises(ValueError, match="not a binary snapshot"):
+        BinarySnapshot(str(path))
+
+
+def test_rejects_truncated_snapshots(snapshots, tmp_path):
+    with open(snapshots["binary"], "rb") as f:
+        data = f.read()
+    path = tmp_path / "truncated.snap"
+    path.write_bytes(data[:-20])
+
+    with pytest.raises(ValueError, match="truncated"):
+        BinarySnapshot(str(path))
+
+
+def test_snapshot_report_reports_bad_input_without_traceback(snapshots, capsys):
+    assert main(["--snapshot-report", snapshots["json"], "status"]) == 1
+    assert capsys.readouterr().err.startswith("Cannot read snapshot:")
+
+    assert main(["--snapshot-report", snapshots["binary"], "status"]) == 0
+    assert "Total tasks: 1" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("report_name", ["bogus", "flow"])
+def test_snapshot_report_rejects_unknown_reports(snapshots, capsys, report_name):
+    assert main(["--snapshot-report", snapshots["binary"], report_name]) == 1
+
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert f"Report generator '{report_name}' not found" in captured.err
@@ -0,0 +1,80 @@
+import pytest
+
+from models.task import Task
+from services.import_export_service import ImportExportService
+from services.task_service import TaskService
+
+
+def test_bulk_create_skips_existing_ids():
+    service = TaskService()
+    service.create_task("Original", "")
+
+    task_ids = service.bulk_create_tasks([{"id": 1, "title": "Clash"}, {"id": 2, "title": "New"}])
+
+    assert task_ids == [2]
+    assert service.get_task_by_id(1).title == "Original"
+
+
+def test_bulk_create_upsert_replaces_existing_ids():
+    service = TaskService()
+    service.create_task("Original", "")
+    seq = service.latest_sequence
+
+    task_ids = service.bulk_create_tasks([{"id": 1, "title": "Replacement"}], notify=True, upsert=True)
+
+    assert task_ids == [1]
+    assert service.get_task_by_id(1).title == "Replacement"
+    assert [change.event_type for change in service.changes_since(seq).changes] == ["replaced"]
+
+
+def test_import_counts_colliding_rows_as_skipped(tmp_path):
+    service = TaskService()
+    service.create_task("Original", "")
+    path = tmp_path / "tasks.csv"
+    path.write_text("id,title\n1,Clash\n2,New\n", encoding="utf-8")
+
+    stats = ImportExportService().import_tasks(service, str(path))
+
+    assert stats.rows == 1
+    assert stats.skipped == 1
+
+
+def test_bad_record_still_resets_change_feed():
+    service = TaskService()
+    service.create_task("First", "")
+    seq = service.latest_sequence
+
+    with pytest.raises(KeyError):
+        service.bulk_create_tasks([{"title": "Second"}, {"description": "missing title"}])
+
+    assert service.changes_since(seq).resync_required
+
+
+def test_import_normalises_string_ids_and_aware_timestamps(tmp_path):
+    service = TaskService()
+    service.create_task("Original", "", "alex")
+    path = tmp_path / "tasks.jsonl"
+    path.write_text('{"id": "12", "title": "Migrated", "assignee": "alex", '
+                    '"created_at": "2024-01-02T00:00:00Z", "updated_at": "2024-01-02T00:00:00+02:00"}\n',
+                    encoding="utf-8")
+
+    stats = ImportExportService().import_tasks(service, str(path))
+
+    task = service.get_task_by_id(12)
+    assert stats.rows == 1
+    assert task.created_at.tzinfo is None
+    assert [t.id for t in service.get_tasks_for_assignee("alex")] == [1, 12]
+    assert [t.id for t in service.get_tasks_created_between(None, task.created_at.replace(year=2025))] == [12]
+
+
+def test_tasks_that_cannot_be_indexed_are_not_stored():
+    service = TaskService()
+    service.create_task("Original", "")
+    bad = Task(5, "Bad", "")
+    bad.created_at = "2024-01-01"
+
+    with pytest.raises(TypeError):
+        service.load_tasks([bad])
+
+    assert service.get_task_by_id(5) is None
+    assert [task.id for task in service.get_all_tasks()] == [1]
@@ -0,0 +1,65 @@
+import pytest
+
+from services.task_service import TaskService
+from models.task import TaskStatus
+
+
+def test_changes_since_returns_newer_deltas():
+    service = TaskService()
+    service.create_task("First", "")
+    seq = service.latest_sequence
+    service.update_task_status(1, TaskStatus.DONE)
+
+    change_set = service.changes_since(seq)
+
+    assert not change_set.resync_required
+    assert [change.event_type for change in change_set.changes] == ["status_changed"]
+    assert change_set.changes[0].data["status"] == "DONE"
+
+
+def test_trimmed_log_requires_resync():
+    service = TaskService(change_log_capacity=2)
+    for idx in range(3):
+        service.create_task(f"Task {idx}", "")
+
+    assert service.changes_since(0).resync_required
+    assert not service.changes_since(1).resync_required
+
+
+def test_bulk_create_without_notify_forces_caught_up_client_to_resync():
+    service = TaskService()
+    service.create_task("First", "")
+    seq = service.latest_sequence
+
+    service.bulk_create_tasks([{"title": "Second"}, {"title": "Third"}])
+
+    assert service.changes_since(seq).resync_required
+    assert service.changes_since(0).resync_required
+    assert not service.changes_since(service.latest_sequence).resync_required
+
+
+def test_changes_after_reset_are_contiguous():
+    service = TaskService()
+    service.bulk_create_tasks([{"title": "Loaded"}])
+    seq = service.latest_sequence
+
+    service.update_task_status(1, TaskStatus.IN_PROGRESS)
+
+    change_set = service.changes_since(seq)
+    assert not change_set.resync_required
+    assert [change.seq for change in change_set.changes] == [seq + 1]
+
+
+def test_load_tasks_on_fresh_service_requires_resync_from_zero():
+    source = TaskService()
+    source.create_task("Snapshot", "")
+
+    service = TaskService()
+    service.load_tasks(source.get_all_tasks())
+
+    assert service.changes_since(0).resync_required
+
+
+def test_change_log_capacity_must_be_positive():
+    with pytest.raises(ValueError):
+        TaskService(change_log_capacity=0)
@@ -0,0 +1,35 @@
+import threading
+
+from services.event_log import EventLogReader, EventLogWriter
+
+
+def test_full_buffer_is_flushed_and_rotated_on_the_flusher_thread(tmp_path, monkeypatch):
+    path = str(tmp_path / "events.jsonl")
+    rotated = threading.Event()
+    rotating_threads = []
+    original_rotate = EventLogWriter._rotate_locked
+
+    def rotate(writer):
+        rotating_threads.append(threading.current_thread().name)
+        original_rotate(writer)
+        rotated.set()
+
+    monkeypatch.setattr(EventLogWriter, "_rotate_locked", rotate)
+    writer = EventLogWriter(path, max_buffer_bytes=10, flush_interval=60, max_file_bytes=10, compress=True)
+    try:
+        writer.write({"task_id": 1, "event": "created"})
+        assert rotated.wait(5)
+    finally:
+        writer.close()
+
+    assert rotating_threads == ["event-log-flusher"]
+    assert [record["task_id"] for record in EventLogReader(path).read()] == [1]
+
+
+def test_close_writes_buffered_records(tmp_path):
+    path = str(tmp_path / "events.jsonl")
+    with EventLogWriter(path, flush_interval=60) as writer:
+        for task_id in range(3):
+            writer.write({"task_id": task_id, "event": "created"})
+
+    assert [record["task_id"] for record in EventLogReader(path).read()] == [0, 1, 2]
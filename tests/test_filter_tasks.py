@@ -0,0 +1,14 @@
+from models.task import Task
+from patterns.strategy import ExpressionFilterStrategy
+from services.task_service import TaskService
+
+
+def test_indexed_and_full_scan_filters_return_id_order():
+    service = TaskService()
+    service.load_tasks([Task(3, "Gamma", "", "alex"), Task(1, "Alpha", "", "alex"), Task(2, "Beta", "", "alex")])
+
+    indexed = service.filter_tasks(ExpressionFilterStrategy("assignee = alex"))
+    scanned = service.filter_tasks(ExpressionFilterStrategy("title CONTAINS a"))
+
+    assert [task.id for task in indexed] == [1, 2, 3]
+    assert [task.id for task in scanned] == [1, 2, 3]
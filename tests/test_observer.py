@@ -0,0 +1,22 @@
+from models.task import Task, TaskStatus
+from patterns.observer import TaskManagerObserver
+
+
+def _task(status=TaskStatus.TODO):
+    task = Task(1, "Login", "")
+    task.status = status
+    return task
+
+
+def test_manager_reports_only_last_relevant_event(capsys):
+    TaskManagerObserver().update_batch(_task(TaskStatus.DONE), ["created", "assignee_changed", "status_changed"])
+
+    output = capsys.readouterr().out
+    assert "marked as completed" in output
+    assert "New task created" not in output
+
+
+def test_manager_suppresses_bursts_ending_in_deleted(capsys):
+    TaskManagerObserver().update_batch(_task(TaskStatus.DONE), ["created", "status_changed", "deleted"])
+
+    assert capsys.readouterr().out == ""
@@ -0,0 +1,46 @@
+from models.task import TaskPriority
+from patterns.template_method import AssigneeReportGenerator, IndexedAssigneeReportGenerator, \
+    PriorityReportGenerator, StatusReportGenerator
+from services.report_service import ReportService
+from services.task_service import TaskService
+
+
+def _service():
+    service = TaskService()
+    service.create_task("Login", "", "maria", TaskPriority.HIGH)
+    service.create_task("Schema", "", "alex")
+    service.create_task("Docs", "")
+    service.create_task("Tests", "", "alex")
+    return service
+
+
+def test_indexed_assignee_report_matches_task_list_report():
+    service = _service()
+
+    indexed = IndexedAssigneeReportGenerator(service)
+
+    expected = AssigneeReportGenerator().generate_report(service.get_all_tasks())
+    assert indexed.generate_indexed_report() == expected
+    assert indexed.generate_report(service.get_all_tasks()) == expected
+
+
+def test_report_service_skips_task_list_for_indexed_generators():
+    service = _service()
+    report_service = ReportService()
+    report_service.register_generator("assignee", IndexedAssigneeReportGenerator(service))
+
+    def get_tasks():
+        raise AssertionError("task list should not be built")
+
+    assert "alex - 2 tasks" in report_service.generate_report_from("assignee", get_tasks)
+
+
+def test_report_order_does_not_change_once_generators_are_built():
+    report_service = ReportService()
+    report_service.register_generator_factory("status", StatusReportGenerator)
+    report_service.register_generator_factory("assignee", AssigneeReportGenerator)
+    report_service.register_generator_factory("priority", PriorityReportGenerator)
+
+    report_service.generate_report("priority", [])
+
+    assert report_service.get_available_reports() == ["status", "assignee", "priority"]
@@ -0,0 +1,32 @@
+import pytest
+
+from models.task import TaskStatus
+from services.sharded_task_service import ShardedTaskService
+
+
+@pytest.fixture
+def service():
+    with ShardedTaskService(shard_count=2) as sharded:
+        yield sharded
+
+
+def test_pipelined_writes_return_results_in_call_order(service):
+    service.create_tasks([{"title": f"Task {idx}", "description": ""} for idx in range(4)])
+
+    tasks = service.update_task_statuses([(4, TaskStatus.DONE), (1, TaskStatus.IN_PROGRESS), (99, TaskStatus.DONE)])
+
+    assert [task.id if task else None for task in tasks] == [4, 1, None]
+    assert service.get_task_by_id(4).status == TaskStatus.DONE
+    assert [status for _, status in service.get_status_history(1)] == [TaskStatus.TODO, TaskStatus.IN_PROGRESS]
+
+
+def test_workload_is_merged_across_shards(service):
+    service.create_tasks([{"title": f"Task {idx}", "description": ""} for idx in range(3)])
+    service.assign_tasks([(1, "alex"), (2, "alex"), (3, "maria")])
+
+    workload = service.get_assignee_workload("alex")
+
+    assert service.get_assignees() == ["alex", "maria"]
+    assert workload.task_ids == [1, 2]
+    assert workload.status_counts[TaskStatus.TODO] == 2
+    assert service.get_assignee_workload("nobody") is None